@@ -18,6 +18,8 @@ from researcher.cli.ui import ResearchUIDisplay
 from researcher.core.agent import BaseAgent
 from researcher.llm.anthropic_client import AnthropicClient
 from researcher.llm.openai_client import OpenAIClient
+from researcher.tools.search_tool import aclose_all as close_search_clients
+from researcher.utils.logger import configure_logger
 from researcher.utils.trace_logger import AgentTraceLogger
 
 # Load environment variables from .env file
@@ -55,6 +57,26 @@ async def run_with_ui(self, task_description: str, ui: ResearchUIDisplay | None
     return result
 
 
+async def run_session(agent: BaseAgent, task_description: str, ui: ResearchUIDisplay | None):
+    """Run an agent with UI callbacks, then release shared search clients.
+
+    The shared Tavily clients are bound to the running event loop, so they
+    are closed before asyncio.run() tears the loop down.
+
+    Args:
+        agent: Agent to run
+        task_description: Task description
+        ui: Optional UI display for real-time updates
+
+    Returns:
+        ToolResult
+    """
+    try:
+        return await run_with_ui(agent, task_description, ui)
+    finally:
+        await close_search_clients()
+
+
 # Store original execute methods for tools
 tool_execute_originals = {}
 
@@ -218,13 +240,10 @@ def research(
     """
     # Configure logger based on debug flag
     if debug:
-        logger.remove()  # Remove default handler
-        logger.add(
-            sys.stderr,
-            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            level="DEBUG",
-        )
+        configure_logger(level="DEBUG")
         logger.debug("Debug mode enabled")
+    else:
+        configure_logger(level=os.getenv("RESEARCHER_LOG_LEVEL", "INFO"))
 
     # Generate workspace directory if not provided
     if workspace is None:
@@ -270,7 +289,7 @@ def research(
         # Start UI
         if ui:
             ui.start(topic)
-        result = asyncio.run(run_with_ui(orchestrator, topic, ui))
+        result = asyncio.run(run_session(orchestrator, topic, ui))
 
         # Log orchestrator completion
         if trace_logger:
@@ -431,13 +450,10 @@ def continue_research(
     """
     # Configure logger based on debug flag
     if debug:
-        logger.remove()  # Remove default handler
-        logger.add(
-            sys.stderr,
-            format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-            level="DEBUG",
-        )
+        configure_logger(level="DEBUG")
         logger.debug("Debug mode enabled")
+    else:
+        configure_logger(level=os.getenv("RESEARCHER_LOG_LEVEL", "INFO"))
 
     workspace_dir = Path(workspace)
 
@@ -493,7 +509,7 @@ def continue_research(
         # Start UI
         if ui:
             ui.start(f"Continue: {original_question}")
-        result = asyncio.run(run_with_ui(orchestrator, continuation_task, ui))
+        result = asyncio.run(run_session(orchestrator, continuation_task, ui))
 
         # Log orchestrator completion
         if trace_logger:
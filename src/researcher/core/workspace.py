@@ -6,6 +6,7 @@ This module provides workspace directory management with:
 - Security checks (prevent access outside workspace)
 """
 
+import os
 from pathlib import Path
 from typing import Any
 
@@ -49,6 +50,12 @@ class WorkspaceManager:
 
         self.workspace_dir = Path(workspace_dir).resolve()
 
+        # Resolved root as a string, used for cheap prefix-based safety checks
+        self._root_str = str(self.workspace_dir)
+        self._root_prefix = (
+            self._root_str if self._root_str.endswith(os.sep) else self._root_str + os.sep
+        )
+
         if create_if_missing:
             self.ensure_workspace_exists()
 
@@ -111,15 +118,38 @@ class WorkspaceManager:
             >>> workspace.is_path_safe("../../../etc/passwd")
             False
         """
+        resolved = str(self.resolve_path(filepath))
+
+        # Pure string comparison against the cached root: no filesystem access
+        return resolved == self._root_str or resolved.startswith(self._root_prefix)
+
+    def locate(self, filepath: str | Path) -> tuple[Path, str | None]:
+        """Resolve a file path and compute its workspace-relative form in one pass.
+
+        Equivalent to resolve_path() + is_path_safe() + get_relative_path(), but
+        resolves the path only once and derives the relative path from the
+        resolved string instead of building further Path objects.
+
+        Args:
+            filepath: File path (relative or absolute)
+
+        Returns:
+            Tuple of (resolved path, relative path string). The relative path
+            is None if the file is outside the workspace.
+
+        Example:
+            >>> workspace = WorkspaceManager("./workspace")
+            >>> workspace.locate("data/results.txt")
+            (PosixPath('/absolute/path/to/workspace/data/results.txt'), 'data/results.txt')
+        """
         resolved = self.resolve_path(filepath)
+        resolved_str = str(resolved)
 
-        try:
-            # Check if resolved path is relative to workspace
-            resolved.relative_to(self.workspace_dir)
-            return True
-        except ValueError:
-            # Path is outside workspace
-            return False
+        if resolved_str == self._root_str:
+            return resolved, "."
+        if resolved_str.startswith(self._root_prefix):
+            return resolved, resolved_str[len(self._root_prefix) :]
+        return resolved, None
 
     def get_relative_path(self, filepath: str | Path) -> Path:
         """Get the relative path from workspace to the given file.
@@ -5,7 +5,10 @@ to interact with the file system and run external programs.
 """
 
 import asyncio
+import os
 import shlex
+import signal
+from contextlib import suppress
 from pathlib import Path
 from typing import Any
 
@@ -27,7 +30,8 @@ class BashTool(Tool):
     - Commands execute in the workspace directory by default
     - Timeout protection prevents infinite execution
     - Interactive commands (vim, nano, etc.) are not supported
-    - Stdout and stderr are captured and returned
+    - Stdout and stderr are captured and returned; output beyond what can
+      be returned is discarded while the command keeps running
 
     Example:
         >>> workspace = WorkspaceManager("/path/to/workspace")
@@ -37,7 +41,10 @@ class BashTool(Tool):
     """
 
     DEFAULT_TIMEOUT = 120  # seconds
+    MAX_TIMEOUT = 600  # seconds
     MAX_OUTPUT_LENGTH = 50000  # characters
+    # Bytes read per stream; enough for MAX_OUTPUT_LENGTH characters of UTF-8
+    MAX_OUTPUT_BYTES = MAX_OUTPUT_LENGTH * 4
 
     def __init__(
         self,
@@ -85,10 +92,10 @@ class BashTool(Tool):
                 "timeout": {
                     "type": "integer",
                     "minimum": 1,
-                    "maximum": 600,
+                    "maximum": self.MAX_TIMEOUT,
                     "default": self.DEFAULT_TIMEOUT,
                     "description": (
-                        f"Timeout in seconds (1-600, default {self.DEFAULT_TIMEOUT}). "
+                        f"Timeout in seconds (1-{self.MAX_TIMEOUT}, default {self.DEFAULT_TIMEOUT}). "
                         "Command will be terminated if it runs longer."
                     ),
                 },
@@ -116,6 +123,7 @@ class BashTool(Tool):
                 "stdout": str,
                 "stderr": str,
                 "timed_out": bool,
+                "output_capped": bool,
                 "command": str
             }
 
@@ -131,13 +139,13 @@ class BashTool(Tool):
                 error="Command must not be empty",
             )
 
-        # Validate timeout
+        # Validate timeout before anything is spawned
         if timeout is None:
             timeout = self.default_timeout
-        elif timeout < 1 or timeout > 600:
+        elif timeout < 1 or timeout > self.MAX_TIMEOUT:
             return ToolResult(
                 success=False,
-                error="Timeout must be between 1 and 600 seconds",
+                error=f"Timeout must be between 1 and {self.MAX_TIMEOUT} seconds",
             )
 
         command = command.strip()
@@ -178,6 +186,8 @@ class BashTool(Tool):
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=str(self.workspace.workspace_dir),
+                # Own process group, so the whole pipeline can be signalled
+                start_new_session=hasattr(os, "killpg"),
             )
         except Exception as e:
             return ToolResult(
@@ -189,15 +199,20 @@ class BashTool(Tool):
         # Wait for completion with timeout
         timed_out = False
         try:
-            stdout_bytes, stderr_bytes = await asyncio.wait_for(
-                process.communicate(),
+            (stdout_bytes, out_capped), (stderr_bytes, err_capped) = await asyncio.wait_for(
+                self._collect_output(process),
                 timeout=timeout,
             )
+        except asyncio.CancelledError:
+            # The command runs in its own session, so Ctrl+C never reaches it;
+            # stop it along with the task that started it
+            self._signal_process(process, getattr(signal, "SIGKILL", signal.SIGTERM))
+            raise
         except asyncio.TimeoutError:
             # Kill process on timeout
             timed_out = True
             try:
-                process.kill()
+                self._signal_process(process, getattr(signal, "SIGKILL", signal.SIGTERM))
                 await process.wait()
             except Exception:
                 pass
@@ -225,14 +240,15 @@ class BashTool(Tool):
 
         # Get exit code
         exit_code = process.returncode or 0
+        output_capped = out_capped or err_capped
 
         # Truncate output if too long
-        if len(stdout) > self.MAX_OUTPUT_LENGTH:
+        if out_capped or len(stdout) > self.MAX_OUTPUT_LENGTH:
             stdout = (
                 stdout[: self.MAX_OUTPUT_LENGTH]
                 + f"\n\n[Output truncated at {self.MAX_OUTPUT_LENGTH} characters]"
             )
-        if len(stderr) > self.MAX_OUTPUT_LENGTH:
+        if err_capped or len(stderr) > self.MAX_OUTPUT_LENGTH:
             stderr = (
                 stderr[: self.MAX_OUTPUT_LENGTH]
                 + f"\n\n[Output truncated at {self.MAX_OUTPUT_LENGTH} characters]"
@@ -258,6 +274,7 @@ class BashTool(Tool):
             "stdout": stdout,
             "stderr": stderr,
             "timed_out": timed_out,
+            "output_capped": output_capped,
         }
 
         if success:
@@ -277,3 +294,68 @@ class BashTool(Tool):
                 error=f"Command exited with code {exit_code}",
                 metadata=metadata,
             )
+
+    async def _collect_output(
+        self,
+        process: asyncio.subprocess.Process,
+    ) -> tuple[tuple[bytes, bool], tuple[bytes, bool]]:
+        """Read stdout and stderr of a process until it exits.
+
+        Args:
+            process: Process started with stdout and stderr pipes
+
+        Returns:
+            (data, capped) pairs for stdout and stderr, see _read_capped()
+        """
+        stdout, stderr = await asyncio.gather(
+            self._read_capped(process.stdout),
+            self._read_capped(process.stderr),
+        )
+        await process.wait()
+        return stdout, stderr
+
+    async def _read_capped(
+        self,
+        stream: asyncio.StreamReader,
+    ) -> tuple[bytes, bool]:
+        """Read a process output stream, keeping at most MAX_OUTPUT_BYTES + 1 bytes.
+
+        Once the cap is exceeded the stream is still drained until the process
+        closes it, so the command runs to completion, but the rest of its
+        output is discarded.
+
+        Args:
+            stream: Process stdout or stderr reader
+
+        Returns:
+            Tuple of (data read, whether the cap was exceeded)
+        """
+        limit = self.MAX_OUTPUT_BYTES
+        chunks: list[bytes] = []
+        size = 0
+        while size <= limit:
+            chunk = await stream.read(limit + 1 - size)
+            if not chunk:
+                return b"".join(chunks), False
+            chunks.append(chunk)
+            size += len(chunk)
+
+        while await stream.read(65536):
+            pass
+        return b"".join(chunks), True
+
+    def _signal_process(self, process: asyncio.subprocess.Process, sig: int) -> None:
+        """Send a signal to a command and every process it started.
+
+        The shell forks commands rather than exec'ing them, so signalling only
+        the shell would leave its children running and holding the output pipes.
+
+        Args:
+            process: Process started by _run_command
+            sig: Signal to send
+        """
+        with suppress(ProcessLookupError):
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, sig)
+            elif process.returncode is None:
+                process.send_signal(sig)
@@ -6,6 +6,12 @@ This module provides tools for reading, writing, and editing files within the wo
 - EditTool: Edit files by replacing text
 """
 
+import asyncio
+import mmap
+import os
+import stat
+import tempfile
+from contextlib import nullcontext, suppress
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +20,84 @@ from loguru import logger
 from researcher.core.tool import Tool, ToolResult
 from researcher.core.workspace import WorkspaceManager
 
+# Slice size used when counting newlines over a memory-mapped file
+_COUNT_CHUNK_SIZE = 1 << 20
+
+
+def _split_lines(text: str) -> list[str]:
+    """Split text on "\n"; a trailing newline ends the last line rather than adding one."""
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    return lines
+
+
+def _skip_lines(mm: mmap.mmap, pos: int, count: int) -> tuple[int, int]:
+    """Advance past up to `count` newlines starting at byte offset `pos`.
+
+    Returns:
+        Tuple of (offset just past the last newline skipped, newlines skipped)
+    """
+    skipped = 0
+    while skipped < count:
+        nxt = mm.find(b"\n", pos)
+        if nxt == -1:
+            break
+        pos = nxt + 1
+        skipped += 1
+    return pos, skipped
+
+
+def _count_occurrences(data: bytes | mmap.mmap, needle: bytes) -> int:
+    """Count non-overlapping occurrences of a non-empty needle."""
+    count = 0
+    pos = data.find(needle)
+    while pos != -1:
+        count += 1
+        pos = data.find(needle, pos + len(needle))
+    return count
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write every chunk to fd, retrying on short writes."""
+    views = [memoryview(chunk) for chunk in chunks if chunk]
+    while views:
+        written = os.writev(fd, views) if hasattr(os, "writev") else os.write(fd, views[0])
+        while written:
+            if written >= len(views[0]):
+                written -= len(views.pop(0))
+            else:
+                views[0] = views[0][written:]
+                written = 0
+
+
+def _replace_file(path: Path, chunks: list[bytes], file_mode: int) -> None:
+    """Atomically replace path with the concatenation of chunks, keeping its permissions."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            _write_all(fd, chunks)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, stat.S_IMODE(file_mode))
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _count_lines(mm: mmap.mmap, pos: int) -> int:
+    """Count lines from byte offset `pos` to EOF without decoding them."""
+    size = len(mm)
+    count = 0
+    for offset in range(pos, size, _COUNT_CHUNK_SIZE):
+        count += mm[offset : offset + _COUNT_CHUNK_SIZE].count(b"\n")
+    if size > pos and mm[size - 1] != ord("\n"):
+        count += 1
+    return count
+
 
 class ReadTool(Tool):
     """Tool for reading file contents.
@@ -90,67 +174,86 @@ class ReadTool(Tool):
         Returns:
             ToolResult with file contents (with line numbers) or error
         """
+        return await asyncio.to_thread(self._read, filepath, start_line, end_line)
+
+    def _read(self, filepath: str, start_line: int | None, end_line: int | None) -> ToolResult:
+        """Read the file synchronously (runs in a worker thread)."""
         try:
             # Resolve and validate path
-            resolved_path = self.workspace.resolve_path(filepath)
+            resolved_path, display_path = self.workspace.locate(filepath)
 
-            if not self.workspace.is_path_safe(resolved_path):
+            if display_path is None:
                 return ToolResult(
                     success=False,
                     error=f"Access denied: {filepath} is outside workspace",
                 )
 
-            if not resolved_path.exists():
+            # Single stat call covers both existence and file-type checks
+            try:
+                st = os.stat(resolved_path)
+            except FileNotFoundError:
                 return ToolResult(success=False, error=f"File not found: {filepath}")
 
-            if not resolved_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return ToolResult(success=False, error=f"Not a file: {filepath}")
 
-            # Read file content
-            with open(resolved_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            total_lines = len(lines)
-
-            # Apply line range if specified
-            if start_line is not None or end_line is not None:
-                start_idx = (start_line - 1) if start_line else 0
-                end_idx = end_line if end_line else total_lines
-
-                # Validate range
-                if start_idx < 0 or start_idx >= total_lines:
-                    return ToolResult(
-                        success=False,
-                        error=f"start_line {start_line} out of range (file has {total_lines} lines)",
-                    )
-
-                if end_idx < start_idx or end_idx > total_lines:
-                    return ToolResult(
-                        success=False,
-                        error=f"end_line {end_line} invalid (must be >= start_line and <= {total_lines})",
-                    )
-
-                selected_lines = lines[start_idx:end_idx]
-                first_line_num = start_idx + 1
-            else:
-                selected_lines = lines
-                first_line_num = 1
+            ranged = start_line is not None or end_line is not None
+            start_idx = (start_line - 1) if start_line else 0
+            selected_lines: list[str] | None = None
+
+            if ranged and st.st_size > 0:
+                # Locate the requested window on the raw bytes and decode only that
+                with (
+                    open(resolved_path, "rb") as f,
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                ):
+                    # Line breaks other than "\n" are left to the text-mode path
+                    # below, so both paths number lines the same way
+                    if mm.find(b"\r") == -1:
+                        start_off, skipped = _skip_lines(mm, 0, max(start_idx, 0))
+
+                        if end_line:
+                            wanted = max(end_line - start_idx, 0)
+                            end_off, found = _skip_lines(mm, start_off, wanted)
+                            if found < wanted and end_off < len(mm):
+                                # Final line has no trailing newline
+                                end_off = len(mm)
+                                found += 1
+                            total_lines = skipped + found + _count_lines(mm, end_off)
+                        else:
+                            end_off = len(mm)
+                            total_lines = skipped + _count_lines(mm, start_off)
+
+                        error = self._range_error(start_line, end_line, total_lines)
+                        if error is not None:
+                            return error
+
+                        selected_lines = _split_lines(mm[start_off:end_off].decode("utf-8"))
+
+            if selected_lines is None:
+                # Read file content (universal newlines)
+                with open(resolved_path, "r", encoding="utf-8") as f:
+                    lines = _split_lines(f.read())
+
+                total_lines = len(lines)
+
+                if ranged:
+                    error = self._range_error(start_line, end_line, total_lines)
+                    if error is not None:
+                        return error
+                    selected_lines = lines[start_idx : end_line or total_lines]
+                else:
+                    selected_lines = lines
+
+            first_line_num = start_idx + 1
 
             # Format with line numbers
-            numbered_lines = []
-            for i, line in enumerate(selected_lines):
-                line_num = first_line_num + i
-                # Remove trailing newline for clean formatting
-                line_content = line.rstrip("\n")
-                numbered_lines.append(f"{line_num:6d}→{line_content}")
-
-            content = "\n".join(numbered_lines)
-
-            # Get relative path for display
-            try:
-                display_path = self.workspace.get_relative_path(resolved_path)
-            except ValueError:
-                display_path = resolved_path
+            content = "\n".join(
+                [
+                    f"{line_num:6d}→{line}"
+                    for line_num, line in enumerate(selected_lines, first_line_num)
+                ]
+            )
 
             logger.info(f"Read file: {display_path} ({len(selected_lines)} lines)")
 
@@ -159,7 +262,7 @@ class ReadTool(Tool):
                 content=content,
                 metadata={
                     "filepath": str(resolved_path),
-                    "relative_path": str(display_path),
+                    "relative_path": display_path,
                     "total_lines": total_lines,
                     "lines_read": len(selected_lines),
                     "start_line": first_line_num,
@@ -176,6 +279,32 @@ class ReadTool(Tool):
             logger.error(f"Error reading file {filepath}: {e}")
             return ToolResult(success=False, error=f"Read error: {str(e)}")
 
+    @staticmethod
+    def _range_error(
+        start_line: int | None, end_line: int | None, total_lines: int
+    ) -> ToolResult | None:
+        """Validate a requested line range against the file's line count.
+
+        Returns:
+            Failed ToolResult describing the problem, or None if the range is valid
+        """
+        start_idx = (start_line - 1) if start_line else 0
+        end_idx = end_line if end_line else total_lines
+
+        if start_idx < 0 or start_idx >= total_lines:
+            return ToolResult(
+                success=False,
+                error=f"start_line {start_line} out of range (file has {total_lines} lines)",
+            )
+
+        if end_idx < start_idx or end_idx > total_lines:
+            return ToolResult(
+                success=False,
+                error=f"end_line {end_line} invalid (must be >= start_line and <= {total_lines})",
+            )
+
+        return None
+
 
 class WriteTool(Tool):
     """Tool for writing content to files.
@@ -251,6 +380,10 @@ class WriteTool(Tool):
         Returns:
             ToolResult indicating success or error
         """
+        return await asyncio.to_thread(self._write, filepath, content, mode)
+
+    def _write(self, filepath: str, content: str, mode: str) -> ToolResult:
+        """Write the file synchronously (runs in a worker thread)."""
         try:
             # Validate mode
             if mode not in ["create", "overwrite", "append"]:
@@ -260,44 +393,44 @@ class WriteTool(Tool):
                 )
 
             # Resolve and validate path
-            resolved_path = self.workspace.resolve_path(filepath)
+            resolved_path, display_path = self.workspace.locate(filepath)
 
-            if not self.workspace.is_path_safe(resolved_path):
+            if display_path is None:
                 return ToolResult(
                     success=False,
                     error=f"Access denied: {filepath} is outside workspace",
                 )
 
-            # Check file existence based on mode
-            file_exists = resolved_path.exists()
-
-            if mode == "create" and file_exists:
-                return ToolResult(
-                    success=False,
-                    error=f"File already exists: {filepath}. Use mode='overwrite' to replace it.",
-                )
-
             # Create parent directories if needed
             resolved_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write file
+            # Write file: encode once and hand the bytes straight to the fd,
+            # skipping the TextIOWrapper's chunked re-encoding
+            flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
             if mode == "append":
-                write_mode = "a"
+                flags |= os.O_APPEND
             else:  # create or overwrite
-                write_mode = "w"
-
-            with open(resolved_path, write_mode, encoding="utf-8") as f:
-                f.write(content)
+                flags |= os.O_TRUNC
+            if mode == "create":
+                flags |= os.O_EXCL
 
-            # Get file info
-            file_size = resolved_path.stat().st_size
-            line_count = content.count("\n") + (1 if content and not content.endswith("\n") else 0)
+            try:
+                fd = os.open(resolved_path, flags, 0o644)
+            except FileExistsError:
+                return ToolResult(
+                    success=False,
+                    error=f"File already exists: {filepath}. Use mode='overwrite' to replace it.",
+                )
 
-            # Get relative path for display
+            data = content.encode("utf-8")
             try:
-                display_path = self.workspace.get_relative_path(resolved_path)
-            except ValueError:
-                display_path = resolved_path
+                _write_all(fd, [data])
+            finally:
+                os.close(fd)
+
+            # Get file info
+            file_size = len(data)
+            line_count = data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0)
 
             action = (
                 "Created"
@@ -311,7 +444,7 @@ class WriteTool(Tool):
                 content=f"{action} {display_path} ({line_count} lines, {file_size} bytes)",
                 metadata={
                     "filepath": str(resolved_path),
-                    "relative_path": str(display_path),
+                    "relative_path": display_path,
                     "mode": mode,
                     "bytes_written": file_size,
                     "line_count": line_count,
@@ -329,6 +462,11 @@ class EditTool(Tool):
     Finds and replaces text in a file. The old_string must match exactly
     and must be unique in the file (to prevent accidental replacements).
 
+    Edits that change the file size replace it atomically with a rewritten
+    copy. Symlinks are followed, so the file they point to is edited, and a
+    file with several hard links is rewritten in place so every link sees
+    the edit. Read-only files are rejected as they would be by a direct write.
+
     Example:
         >>> workspace = WorkspaceManager("./workspace")
         >>> edit_tool = EditTool(workspace)
@@ -391,54 +529,109 @@ class EditTool(Tool):
         Returns:
             ToolResult indicating success or error
         """
+        return await asyncio.to_thread(self._edit, filepath, old_string, new_string)
+
+    def _edit(self, filepath: str, old_string: str, new_string: str) -> ToolResult:
+        """Edit the file synchronously (runs in a worker thread)."""
         try:
             # Resolve and validate path
-            resolved_path = self.workspace.resolve_path(filepath)
+            resolved_path, display_path = self.workspace.locate(filepath)
 
-            if not self.workspace.is_path_safe(resolved_path):
+            if display_path is None:
                 return ToolResult(
                     success=False,
                     error=f"Access denied: {filepath} is outside workspace",
                 )
 
-            if not resolved_path.exists():
+            # Single stat call covers both existence and file-type checks
+            try:
+                st = os.stat(resolved_path)
+            except FileNotFoundError:
                 return ToolResult(success=False, error=f"File not found: {filepath}")
 
-            if not resolved_path.is_file():
+            if not stat.S_ISREG(st.st_mode):
                 return ToolResult(success=False, error=f"Not a file: {filepath}")
 
-            # Read current content
-            with open(resolved_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Check if old_string exists
-            if old_string not in content:
-                return ToolResult(
-                    success=False,
-                    error=f"old_string not found in file: {old_string[:100]}{'...' if len(old_string) > 100 else ''}",
-                )
-
-            # Count occurrences
-            occurrence_count = content.count(old_string)
-            if occurrence_count > 1:
-                return ToolResult(
-                    success=False,
-                    error=f"old_string appears {occurrence_count} times in file. "
-                    f"It must be unique to prevent accidental replacements.",
-                )
-
-            # Perform replacement
-            new_content = content.replace(old_string, new_string)
-
-            # Write back
-            with open(resolved_path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-
-            # Get relative path for display
-            try:
-                display_path = self.workspace.get_relative_path(resolved_path)
-            except ValueError:
-                display_path = resolved_path
+            if not old_string:
+                return ToolResult(success=False, error="old_string must not be empty")
+
+            old_bytes = old_string.encode("utf-8")
+            new_bytes = new_string.encode("utf-8")
+            changed = old_string != new_string
+
+            # Locate old_string on the raw bytes; the file is never decoded
+            with open(resolved_path, "rb") as f:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    if st.st_size
+                    else nullcontext(b"")
+                ) as data:
+                    idx = data.find(old_bytes)
+
+                    # ReadTool shows CRLF files with "\n" line breaks, so text copied
+                    # from its output is matched against the CRLF form as well
+                    if (
+                        idx == -1
+                        and b"\n" in old_bytes
+                        and b"\r" not in old_bytes
+                        and data.find(b"\r\n") != -1
+                    ):
+                        crlf_old = old_bytes.replace(b"\n", b"\r\n")
+                        idx = data.find(crlf_old)
+                        if idx != -1:
+                            old_bytes = crlf_old
+                            new_bytes = new_bytes.replace(b"\r\n", b"\n").replace(b"\n", b"\r\n")
+
+                    # Check if old_string exists
+                    if idx == -1:
+                        return ToolResult(
+                            success=False,
+                            error=f"old_string not found in file: {old_string[:100]}{'...' if len(old_string) > 100 else ''}",
+                        )
+
+                    # Must be unique
+                    if data.find(old_bytes, idx + len(old_bytes)) != -1:
+                        occurrence_count = _count_occurrences(data, old_bytes)
+                        return ToolResult(
+                            success=False,
+                            error=f"old_string appears {occurrence_count} times in file. "
+                            f"It must be unique to prevent accidental replacements.",
+                        )
+
+                    # Identical strings need no write; same-length ones can be patched in place
+                    in_place = (
+                        changed and len(old_bytes) == len(new_bytes) and hasattr(os, "pwrite")
+                    )
+                    rewrite = changed and not in_place
+
+                    if rewrite:
+                        prefix = data[:idx]
+                        suffix = data[idx + len(old_bytes) :]
+
+            if changed:
+                # Opening for writing fails on read-only files, which a rename
+                # over them (needing only directory permissions) would not
+                fd = os.open(resolved_path, os.O_WRONLY)
+                try:
+                    if in_place:
+                        # Patch the bytes at their offset instead of rewriting the file
+                        os.pwrite(fd, new_bytes, idx)
+                    elif st.st_nlink > 1:
+                        # Replacing would detach the other hard links; rewrite from
+                        # the match onwards instead
+                        os.lseek(fd, idx, os.SEEK_SET)
+                        _write_all(fd, [new_bytes, suffix])
+                        os.ftruncate(fd, idx + len(new_bytes) + len(suffix))
+                finally:
+                    os.close(fd)
+
+                if rewrite and st.st_nlink == 1:
+                    # Replace the file a symlink points to, not the link itself
+                    _replace_file(
+                        Path(os.path.realpath(resolved_path)),
+                        [prefix, new_bytes, suffix],
+                        st.st_mode,
+                    )
 
             logger.info(f"Edited file: {display_path}")
 
@@ -447,18 +640,14 @@ class EditTool(Tool):
                 content=f"Edited {display_path}: replaced 1 occurrence",
                 metadata={
                     "filepath": str(resolved_path),
-                    "relative_path": str(display_path),
+                    "relative_path": display_path,
                     "old_length": len(old_string),
                     "new_length": len(new_string),
-                    "size_change": len(new_content) - len(content),
+                    "size_change": len(new_string) - len(old_string),
+                    "file_size": st.st_size + len(new_bytes) - len(old_bytes),
                 },
             )
 
-        except UnicodeDecodeError:
-            return ToolResult(
-                success=False,
-                error=f"Cannot edit {filepath}: file is not valid UTF-8 text",
-            )
         except Exception as e:
             logger.error(f"Error editing file {filepath}: {e}")
             return ToolResult(success=False, error=f"Edit error: {str(e)}")
@@ -4,7 +4,10 @@ This module provides the TavilySearchTool which allows agents to run
 web searches via the Tavily API and receive structured results.
 """
 
+import asyncio
 import os
+import threading
+import weakref
 from typing import Any, Sequence
 
 from loguru import logger
@@ -12,6 +15,55 @@ from tavily import AsyncTavilyClient
 
 from researcher.core.tool import Tool, ToolResult
 
+# One AsyncTavilyClient per event loop and API key, shared by every tool
+# instance so that parallel searches reuse the same HTTP connection pool.
+# Pooled connections belong to the loop that opened them, so each loop gets
+# its own clients, dropped along with the loop.
+_CLIENT_CACHE: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, AsyncTavilyClient]
+] = weakref.WeakKeyDictionary()
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_shared_client(api_key: str) -> AsyncTavilyClient:
+    """Return the running loop's AsyncTavilyClient for an API key, creating it once.
+
+    Outside a running event loop there is nothing to share with, so a new
+    client is returned.
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AsyncTavilyClient(api_key=api_key)
+
+    with _CLIENT_CACHE_LOCK:
+        for closed in [other for other in _CLIENT_CACHE if other.is_closed()]:
+            del _CLIENT_CACHE[closed]
+        clients = _CLIENT_CACHE.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = AsyncTavilyClient(api_key=api_key)
+            clients[api_key] = client
+        return client
+
+
+async def aclose_all() -> None:
+    """Close the running loop's shared Tavily clients and their connection pools.
+
+    Call this on shutdown; tools used afterwards get fresh clients.
+    """
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.pop(asyncio.get_running_loop(), {}).values())
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            await close()
+        except Exception as exc:
+            logger.warning(f"Failed to close Tavily client: {exc}")
+
 
 class TavilySearchTool(Tool):
     """Tool for performing web searches using the Tavily API.
@@ -36,20 +88,29 @@ class TavilySearchTool(Tool):
     MAX_RESULTS_LIMIT = 20
     DEFAULT_SEARCH_DEPTH = "advanced"
     ALLOWED_DEPTHS: Sequence[str] = ("basic", "advanced")
+    METADATA_SNIPPET_LENGTH = 500  # characters kept per result in metadata
 
     def __init__(
         self,
         api_key: str | None = None,
         client: AsyncTavilyClient | None = None,
+        include_raw_response: bool = False,
     ):
         """Initialize the Tavily search tool.
 
         Args:
             api_key: Tavily API key (optional if client provided or env set)
-            client: Preconfigured AsyncTavilyClient (useful for testing)
+            client: Preconfigured AsyncTavilyClient (useful for testing).
+                If omitted, a client shared by all tools with the same API key on
+                the same event loop is used.
+            include_raw_response: If True, also attach the full Tavily response to
+                metadata["raw_response"] (for debugging; can be tens of KB per query)
         """
+        self.include_raw_response = include_raw_response
+        self._client = client
+        self._api_key = api_key
+
         if client is not None:
-            self.client = client
             return
 
         if api_key is None:
@@ -60,8 +121,14 @@ class TavilySearchTool(Tool):
                 "Tavily API key required. Set TAVILY_API_KEY environment variable "
                 "or pass api_key when initializing TavilySearchTool."
             )
+        self._api_key = api_key
 
-        self.client = AsyncTavilyClient(api_key=api_key)
+    @property
+    def client(self) -> AsyncTavilyClient:
+        """Client used for searches: the one passed in, or the shared one for this loop."""
+        if self._client is not None:
+            return self._client
+        return _get_shared_client(self._api_key)
 
     @property
     def name(self) -> str:
@@ -71,7 +138,7 @@ class TavilySearchTool(Tool):
     def description(self) -> str:
         return (
             "Perform a web search using the Tavily API. Returns a concise summary of the "
-            "top findings plus structured metadata with the full JSON response. "
+            "top findings plus structured metadata with the title, URL and snippet of each result. "
             "Use this to gather fresh information from the internet."
         )
 
@@ -152,13 +219,27 @@ class TavilySearchTool(Tool):
         results = response.get("results", [])
         summary = self._build_summary(query, results)
 
+        # Keep only the fields used downstream; full page content is large and
+        # gets re-serialized every time the result is logged or replayed
+        compact_results = [
+            {
+                "title": result.get("title"),
+                "url": result.get("url"),
+                "snippet": (result.get("content") or "")[: self.METADATA_SNIPPET_LENGTH],
+            }
+            for result in results
+        ]
+
         metadata = {
             "query": query,
             "max_results": max_results,
             "search_depth": search_depth,
             "result_count": len(results),
-            "response": response,
+            "answer": response.get("answer"),
+            "results": compact_results,
         }
+        if self.include_raw_response:
+            metadata["raw_response"] = response
 
         return ToolResult(success=True, content=summary, metadata=metadata)
 
@@ -171,7 +252,7 @@ class TavilySearchTool(Tool):
         for result in results[:3]:
             title = result.get("title") or result.get("url", "Unknown source")
             snippet = result.get("content") or result.get("snippet") or ""
-            snippet = snippet.strip()
+            # Tavily snippets are normally clean; only long ones need work
             if len(snippet) > 180:
                 snippet = snippet[:177].rstrip() + "..."
             lines.append(f"- {title}: {snippet}")
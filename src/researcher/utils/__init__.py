@@ -5,7 +5,7 @@ This module provides utility functions and helpers:
 - Logger configuration: Setup logging with loguru
 """
 
-from researcher.utils.logger import configure_logger, get_logger
+from researcher.utils.logger import configure_logger, ensure_logger_configured, get_logger
 from researcher.utils.prompt_loader import PromptLoader
 
-__all__ = ["PromptLoader", "configure_logger", "get_logger"]
+__all__ = ["PromptLoader", "configure_logger", "ensure_logger_configured", "get_logger"]
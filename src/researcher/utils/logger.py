@@ -1,13 +1,24 @@
 """Logger configuration for the Researcher system.
 
 This module configures loguru for consistent logging across the system.
+Importing it installs the default INFO console handler once, replacing only
+loguru's own stderr handler so sinks added by the caller are left alone. The
+CLI calls configure_logger() explicitly.
 """
 
+import os
 import sys
+from contextlib import suppress
 from pathlib import Path
 
 from loguru import logger
 
+# Whether the console handler has been installed in this process
+_CONFIGURED = False
+
+# Handler id loguru assigns to its built-in stderr handler
+_LOGURU_DEFAULT_HANDLER_ID = 0
+
 
 def configure_logger(
     level: str = "INFO",
@@ -26,21 +37,14 @@ def configure_logger(
     Example:
         >>> configure_logger(level="DEBUG", log_file="./logs/researcher.log")
     """
+    global _CONFIGURED
+    _CONFIGURED = True
+
     # Remove default logger
     logger.remove()
 
     # Add console logger with color
-    logger.add(
-        sys.stderr,
-        format=(
-            "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
-        ),
-        level=level,
-        colorize=True,
-    )
+    _add_console_handler(level)
 
     # Add file logger if specified
     if log_file:
@@ -64,9 +68,43 @@ def configure_logger(
         logger.info(f"Logging to file: {log_path}")
 
 
+def _add_console_handler(level: str) -> None:
+    """Add the colored stderr handler used by the Researcher system."""
+    logger.add(
+        sys.stderr,
+        format=(
+            "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
+            "<level>{level: <8}</level> | "
+            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+            "<level>{message}</level>"
+        ),
+        level=level,
+        colorize=True,
+    )
+
+
+def ensure_logger_configured() -> None:
+    """Install the default console handler unless logging is already configured.
+
+    Unlike configure_logger(), this removes only loguru's built-in stderr
+    handler, so sinks added by the caller keep receiving messages. The level
+    comes from the RESEARCHER_LOG_LEVEL environment variable, INFO if unset.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    _CONFIGURED = True
+
+    with suppress(ValueError):  # already removed by the caller
+        logger.remove(_LOGURU_DEFAULT_HANDLER_ID)
+    _add_console_handler(os.getenv("RESEARCHER_LOG_LEVEL", "INFO"))
+
+
 def get_logger(name: str):
     """Get a logger instance with a specific name.
 
+    Installs the default console handler if needed, see ensure_logger_configured().
+
     Args:
         name: Logger name (usually __name__)
 
@@ -77,8 +115,9 @@ def get_logger(name: str):
         >>> log = get_logger(__name__)
         >>> log.info("Hello from my module")
     """
+    ensure_logger_configured()
     return logger.bind(name=name)
 
 
-# Configure default logger (INFO level, console only)
-configure_logger(level="INFO")
+# Install the default console handler (INFO level unless overridden)
+ensure_logger_configured()
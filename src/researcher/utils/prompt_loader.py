@@ -3,6 +3,7 @@
 This module provides utilities for loading and managing system prompts.
 """
 
+import os
 from pathlib import Path
 
 from loguru import logger
@@ -35,6 +36,11 @@ class PromptLoader:
             prompts_dir = researcher_root / "prompts"
 
         self.prompts_dir = Path(prompts_dir).resolve()
+
+        # Cached result of list_prompts(), keyed by the directory's mtime
+        self._list_mtime: int | None = None
+        self._list_cache: list[str] = []
+
         logger.debug(f"PromptLoader initialized: {self.prompts_dir}")
 
     def load(self, prompt_name: str) -> str:
@@ -115,11 +121,23 @@ class PromptLoader:
             >>> print(prompts)
             ['orchestrator', 'searcher', 'analyzer', 'writer']
         """
-        if not self.prompts_dir.exists():
+        try:
+            dir_stat = os.stat(self.prompts_dir)
+        except FileNotFoundError:
             return []
 
-        prompt_files = self.prompts_dir.glob("*.txt")
-        return sorted([f.stem for f in prompt_files])
+        # Adding or removing a prompt file bumps the directory mtime
+        if dir_stat.st_mtime_ns == self._list_mtime:
+            return list(self._list_cache)
+
+        with os.scandir(self.prompts_dir) as it:
+            names = sorted(
+                entry.name[:-4] for entry in it if entry.name.endswith(".txt") and entry.is_file()
+            )
+
+        self._list_mtime = dir_stat.st_mtime_ns
+        self._list_cache = names
+        return list(names)
 
     def exists(self, prompt_name: str) -> bool:
         """Check if a prompt file exists.
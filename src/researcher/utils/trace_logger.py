@@ -4,10 +4,87 @@ This module records the complete execution trace of the multi-agent system,
 including agent decisions, tool calls, LLM interactions, and resource usage.
 """
 
+import asyncio
+import atexit
 import json
-from datetime import datetime
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
+
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib encoder
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # only needed for format="msgpack"
+    msgpack = None
+
+# Queue sentinel telling the writer thread to drain and exit
+_STOP = object()
+
+# Row templates for the markdown statistics tables
+_AGENT_ROW = "| {agent} | {calls} | {tool_calls} | {successes} | {failures} |\n"
+_TOOL_ROW = "| {tool} | {calls} | {successes} | {failures} | {rate:.1f}% |\n"
+
+# Little-endian uint32 length prefix of each msgpack frame
+_FRAME_HEADER = struct.Struct("<I")
+
+
+def _encode_json_line(obj: Any) -> bytes:
+    """Encode an object as one compact UTF-8 JSON line, using orjson when available.
+
+    orjson rejects some values the stdlib encoder accepts (integers wider than
+    64 bits), so those objects fall back to json.dumps.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+            )
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    return (json.dumps(obj, default=str, ensure_ascii=False, separators=(",", ":")) + "\n").encode(
+        "utf-8"
+    )
+
+
+def _encode_msgpack_frame(obj: Any) -> bytes:
+    """Encode an object as one length-prefixed msgpack frame."""
+    buf = msgpack.packb(obj, default=str, use_bin_type=True)
+    return _FRAME_HEADER.pack(len(buf)) + buf
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing."""
+
+
+async def _anoop(*args: Any, **kwargs: Any) -> None:
+    """Accept any arguments and do nothing, asynchronously."""
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Write a batch of lines to fd, as one vectored write where supported."""
+    if hasattr(os, "writev"):
+        written = os.writev(fd, lines)
+        total = sum(map(len, lines))
+        if written == total:
+            return
+        data = b"".join(lines)[written:]
+    else:
+        data = b"".join(lines)
+
+    while data:
+        data = data[os.write(fd, data) :]
 
 
 class AgentTraceLogger:
@@ -15,24 +92,77 @@ class AgentTraceLogger:
 
     Records all agent activities, tool calls, and decisions to help
     analyze and improve the multi-agent framework.
+
+    Trace events are handed to a background writer thread through a queue,
+    so logging calls only enqueue; the thread serializes them and writes in
+    batches through a long-lived file descriptor; an event waits at most
+    flush_interval_ms for others to share its write. The markdown timeline is
+    appended by the same thread as events are written, so finalize() only has
+    to add the summary statistics. Call finalize() (or rely on the atexit
+    hook) to make sure queued events reach disk.
+
+    Constructing it with enabled=False returns a _NullLogger instead, whose
+    logging methods do nothing, so disabled tracing costs no checks per event.
+
+    With format="msgpack" (requires the msgpack package) events are written
+    to agent_trace.msgpack as length-prefixed msgpack frames instead, which
+    is smaller and faster to parse than JSONL. The markdown summary is the
+    same for both formats.
     """
 
-    def __init__(self, workspace_dir: str | Path, enabled: bool = True):
+    # Maximum number of events serialized into a single write
+    FLUSH_MAX_EVENTS = 256
+    # Default time an event may wait for others to share its write
+    DEFAULT_FLUSH_INTERVAL_MS = 500
+
+    def __new__(cls, workspace_dir: str | Path, enabled: bool = True, *args, **kwargs):
+        """Create a trace logger, or a no-op one when tracing is disabled."""
+        if not enabled:
+            cls = _NullLogger
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        workspace_dir: str | Path,
+        enabled: bool = True,
+        format: Literal["jsonl", "msgpack"] = "jsonl",
+        flush_interval_ms: int = DEFAULT_FLUSH_INTERVAL_MS,
+    ):
         """Initialize trace logger.
 
         Args:
             workspace_dir: Workspace directory
             enabled: Whether tracing is enabled
+            format: Event file format, "jsonl" or "msgpack"
+            flush_interval_ms: Longest time an event waits for more events to
+                batch with before it is written (0 writes immediately)
+
+        Raises:
+            ValueError: If format is not supported
+            ImportError: If format is "msgpack" but msgpack is not installed
         """
+        if format == "jsonl":
+            self._encode = _encode_json_line
+        elif format == "msgpack":
+            if msgpack is None:
+                raise ImportError("msgpack is required for format='msgpack': pip install msgpack")
+            self._encode = _encode_msgpack_frame
+        else:
+            raise ValueError(f"Unsupported trace format: {format}")
+
         self.workspace_dir = Path(workspace_dir)
         self.enabled = enabled
-        self.trace_file = self.workspace_dir / "agent_trace.jsonl"
+        self.format = format
+        self.flush_interval_ms = flush_interval_ms
+        self.trace_file = self.workspace_dir / f"agent_trace.{format}"
         self.trace_md_file = self.workspace_dir / "agent_trace.md"
 
-        # In-memory trace for current session
-        self.trace_events: list[dict[str, Any]] = []
         self.session_start = datetime.now()
 
+        # Events carry a cheap monotonic "ts_ns"; wall-clock time is derived
+        # from this reference point only when events are rendered
+        self._t0_ns = time.monotonic_ns()
+
         # Statistics
         self.stats = {
             "total_agent_calls": 0,
@@ -42,8 +172,26 @@ class AgentTraceLogger:
             "tools": {},  # Per-tool statistics
         }
 
-        if self.enabled:
-            self._write_header()
+        # Direct references to the per-agent/per-tool dicts inside self.stats
+        self._agent_stats: dict[str, dict[str, int]] = {}
+        self._tool_stats: dict[str, dict[str, int]] = {}
+
+        # Event file and markdown timeline output, written by a background thread
+        self._fd: int | None = None
+        self._md_fd: int | None = None
+        self._q: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+        self._record: dict[str, Any] = {}  # scratch record, writer thread only
+
+        self._write_header()
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._fd = os.open(self.trace_file, flags, 0o644)
+        self._md_fd = os.open(self.trace_md_file, flags, 0o644)
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="agent-trace-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self._close)
 
     def log_agent_start(self, agent_type: str, task: str, parent_agent: str | None = None):
         """Log agent start event.
@@ -53,30 +201,19 @@ class AgentTraceLogger:
             task: Task description
             parent_agent: Parent agent if this is a sub-agent call
         """
-        if not self.enabled:
-            return
-
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "agent_start",
             "agent_type": agent_type,
             "task": task,
             "parent_agent": parent_agent,
         }
 
-        self.trace_events.append(event)
         self._write_event(event)
 
         # Update stats
         self.stats["total_agent_calls"] += 1
-        if agent_type not in self.stats["agents"]:
-            self.stats["agents"][agent_type] = {
-                "calls": 0,
-                "tool_calls": 0,
-                "successes": 0,
-                "failures": 0,
-            }
-        self.stats["agents"][agent_type]["calls"] += 1
+        self._agent_entry(agent_type)["calls"] += 1
 
     def log_agent_complete(self, agent_type: str, success: bool, summary: str, steps_used: int = 0):
         """Log agent completion event.
@@ -87,11 +224,8 @@ class AgentTraceLogger:
             summary: Completion summary
             steps_used: Number of steps used
         """
-        if not self.enabled:
-            return
-
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "agent_complete",
             "agent_type": agent_type,
             "success": success,
@@ -99,14 +233,10 @@ class AgentTraceLogger:
             "steps_used": steps_used,
         }
 
-        self.trace_events.append(event)
         self._write_event(event)
 
         # Update stats
-        if success:
-            self.stats["agents"][agent_type]["successes"] += 1
-        else:
-            self.stats["agents"][agent_type]["failures"] += 1
+        self._agent_entry(agent_type)["successes" if success else "failures"] += 1
 
     def log_tool_call(self, agent_type: str, tool_name: str, arguments: dict[str, Any]):
         """Log tool call event.
@@ -116,35 +246,26 @@ class AgentTraceLogger:
             tool_name: Name of the tool
             arguments: Tool arguments
         """
-        if not self.enabled:
-            return
-
         # Truncate long arguments for readability
-        truncated_args = {}
-        for key, value in arguments.items():
-            if isinstance(value, str) and len(value) > 100:
-                truncated_args[key] = value[:100] + "..."
-            else:
-                truncated_args[key] = value
+        truncated_args = {
+            key: value[:100] + "..." if isinstance(value, str) and len(value) > 100 else value
+            for key, value in arguments.items()
+        }
 
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "tool_call",
             "agent_type": agent_type,
             "tool_name": tool_name,
             "arguments": truncated_args,
         }
 
-        self.trace_events.append(event)
         self._write_event(event)
 
         # Update stats
         self.stats["total_tool_calls"] += 1
-        self.stats["agents"][agent_type]["tool_calls"] += 1
-
-        if tool_name not in self.stats["tools"]:
-            self.stats["tools"][tool_name] = {"calls": 0, "successes": 0, "failures": 0}
-        self.stats["tools"][tool_name]["calls"] += 1
+        self._agent_entry(agent_type)["tool_calls"] += 1
+        self._tool_entry(tool_name)["calls"] += 1
 
     def log_tool_result(self, agent_type: str, tool_name: str, success: bool, content: str = ""):
         """Log tool result event.
@@ -155,14 +276,11 @@ class AgentTraceLogger:
             success: Whether tool execution succeeded
             content: Result content (truncated)
         """
-        if not self.enabled:
-            return
-
         # Truncate content
         truncated_content = content[:200] + "..." if len(content) > 200 else content
 
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "tool_result",
             "agent_type": agent_type,
             "tool_name": tool_name,
@@ -170,14 +288,10 @@ class AgentTraceLogger:
             "content": truncated_content,
         }
 
-        self.trace_events.append(event)
         self._write_event(event)
 
         # Update stats
-        if success:
-            self.stats["tools"][tool_name]["successes"] += 1
-        else:
-            self.stats["tools"][tool_name]["failures"] += 1
+        self._tool_entry(tool_name)["successes" if success else "failures"] += 1
 
     def log_llm_call(
         self,
@@ -194,11 +308,8 @@ class AgentTraceLogger:
             input_tokens: Input tokens used
             output_tokens: Output tokens generated
         """
-        if not self.enabled:
-            return
-
         event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "llm_call",
             "agent_type": agent_type,
             "model": model,
@@ -206,125 +317,361 @@ class AgentTraceLogger:
             "output_tokens": output_tokens,
         }
 
-        self.trace_events.append(event)
         self._write_event(event)
 
         # Update stats
         self.stats["total_llm_calls"] += 1
 
+    def _agent_entry(self, agent_type: str) -> dict[str, int]:
+        """Get the statistics dict for an agent, creating it on first use.
+
+        Args:
+            agent_type: Type of agent
+
+        Returns:
+            The same dict object stored in self.stats["agents"]
+        """
+        entry = self._agent_stats.get(agent_type)
+        if entry is None:
+            # Keys live for the whole session; intern them so every later
+            # lookup with the same literal is an identity match
+            agent_type = sys.intern(agent_type)
+            entry = {"calls": 0, "tool_calls": 0, "successes": 0, "failures": 0}
+            self._agent_stats[agent_type] = entry
+            self.stats["agents"][agent_type] = entry
+        return entry
+
+    def _tool_entry(self, tool_name: str) -> dict[str, int]:
+        """Get the statistics dict for a tool, creating it on first use.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            The same dict object stored in self.stats["tools"]
+        """
+        entry = self._tool_stats.get(tool_name)
+        if entry is None:
+            tool_name = sys.intern(tool_name)
+            entry = {"calls": 0, "successes": 0, "failures": 0}
+            self._tool_stats[tool_name] = entry
+            self.stats["tools"][tool_name] = entry
+        return entry
+
     def finalize(self):
         """Finalize trace and write summary.
 
-        Writes statistics and markdown summary.
+        Writes statistics and markdown summary. The summary is rendered while
+        the writer thread is still draining the remaining events.
         """
-        if not self.enabled:
-            return
+        duration = self._log_session_complete()
+        summary = self._render_markdown_summary(duration)
+        self._close()
+        self._append_markdown(summary)
+
+    async def afinalize(self):
+        """Finalize trace and write summary without blocking the event loop.
 
-        # Calculate session duration
-        duration = (datetime.now() - self.session_start).total_seconds()
+        Async counterpart of finalize(): draining the writer thread and
+        rendering the summary run concurrently in worker threads.
+        """
+        duration = self._log_session_complete()
+        _, summary = await asyncio.gather(
+            asyncio.to_thread(self._close),
+            asyncio.to_thread(self._render_markdown_summary, duration),
+        )
+        # Appended only after the writer is closed, so it follows the timeline
+        await asyncio.to_thread(self._append_markdown, summary)
+
+    def _log_session_complete(self) -> float:
+        """Queue the final statistics event.
+
+        Returns:
+            Session duration in seconds
+        """
+        duration = (time.monotonic_ns() - self._t0_ns) / 1e9
 
-        # Write final statistics
         stats_event = {
-            "timestamp": datetime.now().isoformat(),
+            "ts_ns": time.monotonic_ns(),
             "event_type": "session_complete",
             "duration_seconds": duration,
             "statistics": self.stats,
         }
         self._write_event(stats_event)
-
-        # Write markdown summary
-        self._write_markdown_summary(duration)
+        return duration
 
     def _write_header(self):
         """Write trace file header."""
-        # JSONL file - no header needed, just ensure file exists
+        # Event file - no header needed, just ensure file exists
         self.trace_file.touch()
 
-        # Markdown file header
+        # Markdown file header; timeline entries follow as events are written
         with open(self.trace_md_file, "w") as f:
             f.write("# Agent Trace Log\n\n")
             f.write(f"Session started: {self.session_start.isoformat()}\n\n")
             f.write("---\n\n")
+            f.write("## Event Timeline\n\n")
 
     def _write_event(self, event: dict[str, Any]):
-        """Write event to JSONL file.
+        """Queue event for the trace writer thread.
 
         Args:
             event: Event dictionary
         """
-        with open(self.trace_file, "a") as f:
-            f.write(json.dumps(event) + "\n")
+        self._q.put(event)
+
+    def _fmt_ts(self, ts_ns: int) -> datetime:
+        """Convert a monotonic event timestamp to wall-clock time.
+
+        Args:
+            ts_ns: Value of time.monotonic_ns() recorded with the event
+
+        Returns:
+            Corresponding local datetime
+        """
+        return self.session_start + timedelta(microseconds=(ts_ns - self._t0_ns) // 1000)
+
+    def _encode_record(self, event: dict[str, Any]) -> bytes:
+        """Encode the trace record for an event, with an ISO "timestamp" field.
 
-    def _write_markdown_summary(self, duration: float):
-        """Write human-readable markdown summary.
+        The record is assembled in a scratch dict owned by the writer thread
+        and reused for every event; the event itself is left untouched.
+
+        Args:
+            event: Event dictionary
+
+        Returns:
+            Encoded JSON line or msgpack frame
+        """
+        record = self._record
+        record.clear()
+        record["timestamp"] = self._fmt_ts(event["ts_ns"]).isoformat()
+        record.update(event)
+        del record["ts_ns"]
+        return self._encode(record)
+
+    def _timeline_entry(self, record: dict[str, Any]) -> str | None:
+        """Format the markdown timeline line for a trace record.
+
+        Args:
+            record: Trace record, with its ISO "timestamp" field
+
+        Returns:
+            Markdown bullet, or None for events not shown in the timeline
+        """
+        timestamp = record["timestamp"].split("T")[1].split(".")[0]
+        event_type = record["event_type"]
+
+        if event_type == "agent_start":
+            return (
+                f"- **{timestamp}** - 🚀 `{record['agent_type']}` started: "
+                f"{record['task'][:80]}...\n"
+            )
+        if event_type == "agent_complete":
+            status = "✅" if record["success"] else "❌"
+            return (
+                f"- **{timestamp}** - {status} `{record['agent_type']}` "
+                f"completed ({record.get('steps_used', 0)} steps)\n"
+            )
+        if event_type == "tool_call":
+            return f"  - **{timestamp}** - 🔧 `{record['agent_type']}` → `{record['tool_name']}`\n"
+        if event_type == "tool_result":
+            status = "✓" if record["success"] else "✗"
+            return (
+                f"  - **{timestamp}** - {status} `{record['tool_name']}`: "
+                f"{record['content'][:60]}...\n"
+            )
+        if event_type == "llm_call":
+            return (
+                f"  - **{timestamp}** - 🤖 LLM call ({record['model']}): "
+                f"{record['input_tokens']}→{record['output_tokens']} tokens\n"
+            )
+        return None
+
+    def _writer_loop(self):
+        """Drain the queue, writing each batch of events with a single call.
+
+        A batch is written once it holds FLUSH_MAX_EVENTS events, once
+        flush_interval_ms has passed since its first event, or as soon as a
+        flush or close is requested.
+        """
+        interval = self.flush_interval_ms / 1000
+        while True:
+            item = self._q.get()
+            deadline = time.monotonic() + interval
+            lines: list[bytes] = []
+            md_lines: list[bytes] = []
+            waiters: list[threading.Event] = []
+            stop = False
+
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                # A malformed event is skipped rather than allowed to kill the thread
+                try:
+                    lines.append(self._encode_record(item))
+                except Exception as e:
+                    logger.warning(f"Skipping agent trace event that failed to encode: {e}")
+                else:
+                    try:
+                        entry = self._timeline_entry(self._record)
+                    except Exception as e:
+                        logger.warning(f"Skipping timeline entry for agent trace event: {e}")
+                    else:
+                        if entry is not None:
+                            md_lines.append(entry.encode("utf-8"))
+                if len(lines) >= self.FLUSH_MAX_EVENTS:
+                    break
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._q.get(timeout=remaining)
+                    else:
+                        item = self._q.get_nowait()
+                except queue.Empty:
+                    break
+
+            if lines:
+                try:
+                    _write_lines(self._fd, lines)
+                    if md_lines:
+                        _write_lines(self._md_fd, md_lines)
+                except Exception as e:
+                    logger.warning(f"Failed to write agent trace events: {e}")
+
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _flush(self):
+        """Block until every event queued so far has been written."""
+        if self._writer is None:
+            return
+
+        done = threading.Event()
+        self._q.put(done)
+        # Poll so a writer thread that died unexpectedly cannot block us forever
+        while not done.wait(0.1):
+            if not self._writer.is_alive():
+                logger.warning("Agent trace writer thread is not running; events were lost")
+                return
+
+    def _close(self):
+        """Write remaining events, stop the writer thread and close the files."""
+        if self._writer is None:
+            return
+
+        self._q.put(_STOP)
+        self._writer.join()
+        self._writer = None
+        os.close(self._fd)
+        os.close(self._md_fd)
+        self._fd = None
+        self._md_fd = None
+        atexit.unregister(self._close)
+
+    def _render_markdown_summary(self, duration: float) -> str:
+        """Render the session summary for the markdown trace.
+
+        The event timeline is already in the file, written as events were
+        logged; the summary is appended after it.
 
         Args:
             duration: Session duration in seconds
+
+        Returns:
+            Markdown text
         """
-        with open(self.trace_md_file, "a") as f:
-            f.write("\n\n## Session Summary\n\n")
-            f.write(f"- **Duration**: {duration:.2f} seconds\n")
-            f.write(f"- **Total Agent Calls**: {self.stats['total_agent_calls']}\n")
-            f.write(f"- **Total Tool Calls**: {self.stats['total_tool_calls']}\n")
-            f.write(f"- **Total LLM Calls**: {self.stats['total_llm_calls']}\n\n")
-
-            # Agent statistics
-            f.write("### Agent Statistics\n\n")
-            f.write("| Agent | Calls | Tools | Success | Failure |\n")
-            f.write("|-------|-------|-------|---------|----------|\n")
-            for agent_type, stats in self.stats["agents"].items():
-                f.write(
-                    f"| {agent_type} | {stats['calls']} | {stats['tool_calls']} | "
-                    f"{stats['successes']} | {stats['failures']} |\n"
-                )
-            f.write("\n")
-
-            # Tool statistics
-            f.write("### Tool Statistics\n\n")
-            f.write("| Tool | Calls | Success | Failure | Success Rate |\n")
-            f.write("|------|-------|---------|---------|-------------|\n")
-            for tool_name, stats in self.stats["tools"].items():
-                total = stats["calls"]
-                success_rate = (stats["successes"] / total * 100) if total > 0 else 0
-                f.write(
-                    f"| {tool_name} | {total} | {stats['successes']} | "
-                    f"{stats['failures']} | {success_rate:.1f}% |\n"
+        parts: list[str] = []
+        append = parts.append
+        append("\n## Session Summary\n\n")
+        append(f"- **Duration**: {duration:.2f} seconds\n")
+        append(f"- **Total Agent Calls**: {self.stats['total_agent_calls']}\n")
+        append(f"- **Total Tool Calls**: {self.stats['total_tool_calls']}\n")
+        append(f"- **Total LLM Calls**: {self.stats['total_llm_calls']}\n\n")
+
+        # Agent statistics
+        append("### Agent Statistics\n\n")
+        append("| Agent | Calls | Tools | Success | Failure |\n")
+        append("|-------|-------|-------|---------|----------|\n")
+        append(
+            "".join(
+                _AGENT_ROW.format_map({"agent": agent_type, **stats})
+                for agent_type, stats in self.stats["agents"].items()
+            )
+        )
+        append("\n")
+
+        # Tool statistics
+        append("### Tool Statistics\n\n")
+        append("| Tool | Calls | Success | Failure | Success Rate |\n")
+        append("|------|-------|---------|---------|-------------|\n")
+        append(
+            "".join(
+                _TOOL_ROW.format_map(
+                    {
+                        "tool": tool_name,
+                        "rate": (stats["successes"] / stats["calls"] * 100)
+                        if stats["calls"] > 0
+                        else 0,
+                        **stats,
+                    }
                 )
-            f.write("\n")
-
-            # Event timeline
-            f.write("### Event Timeline\n\n")
-            for event in self.trace_events:
-                timestamp = event["timestamp"].split("T")[1].split(".")[0]
-                event_type = event["event_type"]
-
-                if event_type == "agent_start":
-                    f.write(
-                        f"- **{timestamp}** - 🚀 `{event['agent_type']}` started: "
-                        f"{event['task'][:80]}...\n"
-                    )
-                elif event_type == "agent_complete":
-                    status = "✅" if event["success"] else "❌"
-                    f.write(
-                        f"- **{timestamp}** - {status} `{event['agent_type']}` "
-                        f"completed ({event.get('steps_used', 0)} steps)\n"
-                    )
-                elif event_type == "tool_call":
-                    f.write(
-                        f"  - **{timestamp}** - 🔧 `{event['agent_type']}` → "
-                        f"`{event['tool_name']}`\n"
-                    )
-                elif event_type == "tool_result":
-                    status = "✓" if event["success"] else "✗"
-                    f.write(
-                        f"  - **{timestamp}** - {status} `{event['tool_name']}`: "
-                        f"{event['content'][:60]}...\n"
-                    )
-                elif event_type == "llm_call":
-                    f.write(
-                        f"  - **{timestamp}** - 🤖 LLM call ({event['model']}): "
-                        f"{event['input_tokens']}→{event['output_tokens']} tokens\n"
-                    )
-
-            f.write("\n---\n\n")
-            f.write(f"Session ended: {datetime.now().isoformat()}\n")
+                for tool_name, stats in self.stats["tools"].items()
+            )
+        )
+        append("\n---\n\n")
+        append(f"Session ended: {datetime.now().isoformat()}\n")
+        return "".join(parts)
+
+    def _append_markdown(self, text: str):
+        """Append text to the markdown trace with a single write.
+
+        Args:
+            text: Markdown text
+        """
+        with open(self.trace_md_file, "a") as f:
+            f.write(text)
+
+
+class _NullLogger(AgentTraceLogger):
+    """Trace logger returned for enabled=False; every method is a no-op."""
+
+    def __init__(
+        self,
+        workspace_dir: str | Path,
+        enabled: bool = False,
+        format: Literal["jsonl", "msgpack"] = "jsonl",
+        flush_interval_ms: int = 0,
+    ):
+        """Initialize a disabled trace logger without touching the filesystem.
+
+        Args:
+            workspace_dir: Workspace directory
+            enabled: Ignored; always False
+            format: Ignored
+            flush_interval_ms: Ignored
+        """
+        self.workspace_dir = Path(workspace_dir)
+        self.enabled = False
+        self.format = format
+        self.trace_file = self.workspace_dir / f"agent_trace.{format}"
+        self.trace_md_file = self.workspace_dir / "agent_trace.md"
+        self.stats = {
+            "total_agent_calls": 0,
+            "total_tool_calls": 0,
+            "total_llm_calls": 0,
+            "agents": {},
+            "tools": {},
+        }
+
+    # One shared static no-op: calls skip bound-method creation entirely
+    log_agent_start = log_agent_complete = staticmethod(_noop)
+    log_tool_call = log_tool_result = log_llm_call = staticmethod(_noop)
+    finalize = staticmethod(_noop)
+    afinalize = staticmethod(_anoop)
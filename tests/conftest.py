@@ -0,0 +1,30 @@
+"""Shared pytest fixtures."""
+
+import os
+import sys
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # optional; tests fall back to the default asyncio loop
+    uvloop = None
+
+
+if uvloop is not None and sys.platform != "win32":
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed (it has no Windows support)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def _root_tmp(tmp_path_factory):
+    """Create one root directory shared by all workspaces in the session.
+
+    The directory name includes the pytest-xdist worker id, so parallel
+    workers (pytest -n auto) never share workspaces.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "")
+    return tmp_path_factory.mktemp(f"ws_root_{worker}" if worker else "ws_root")
@@ -1,6 +1,7 @@
 """Tests for BashTool."""
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
 
@@ -11,11 +12,9 @@ from researcher.tools.bash_tool import BashTool
 
 
 @pytest.fixture
-def workspace():
-    """Create a temporary workspace for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        workspace = WorkspaceManager(tmpdir)
-        yield workspace
+def workspace(_root_tmp):
+    """Create a temporary workspace for testing, in its own subdirectory."""
+    return WorkspaceManager(tempfile.mkdtemp(dir=_root_tmp))
 
 
 @pytest.fixture
@@ -126,15 +125,16 @@ class TestBashTool:
         assert "must not be empty" in result.error.lower()
 
     @pytest.mark.asyncio
-    async def test_execute_invalid_timeout(self, bash_tool):
-        """Test executing with invalid timeout."""
-        # Timeout too small
-        result = await bash_tool.execute(command="echo test", timeout=0)
-        assert result.success is False
-        assert "timeout" in result.error.lower()
+    @pytest.mark.parametrize("timeout", [0, 1000])
+    async def test_execute_invalid_timeout(self, bash_tool, monkeypatch, timeout):
+        """Test that an out-of-range timeout is rejected without spawning a shell."""
+
+        async def no_spawn(*args, **kwargs):
+            raise AssertionError("subprocess must not be started")
+
+        monkeypatch.setattr(asyncio, "create_subprocess_shell", no_spawn)
 
-        # Timeout too large
-        result = await bash_tool.execute(command="echo test", timeout=1000)
+        result = await bash_tool.execute(command="echo test", timeout=timeout)
         assert result.success is False
         assert "timeout" in result.error.lower()
 
@@ -199,3 +199,46 @@ class TestBashTool:
         # Output should be truncated
         if len(result.metadata["stdout"]) > max_len:
             assert "truncated" in result.metadata["stdout"].lower()
+
+    @pytest.mark.asyncio
+    async def test_output_flood_runs_to_completion(self, bash_tool, workspace):
+        """Test that output beyond the cap is discarded without stopping the command."""
+        flood = BashTool.MAX_OUTPUT_BYTES + 100000
+        result = await bash_tool.execute(
+            command=f"head -c {flood} /dev/zero | tr '\\0' x; echo built > done.txt; exit 3",
+            timeout=10,
+        )
+
+        assert result.success is False
+        assert result.metadata["exit_code"] == 3
+        assert result.metadata["output_capped"] is True
+        assert result.metadata["timed_out"] is False
+        assert "truncated" in result.metadata["stdout"].lower()
+        assert (workspace.workspace_dir / "done.txt").read_text() == "built\n"
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+    async def test_cancel_stops_command_group(self, bash_tool, workspace):
+        """Test that cancelling the call kills the command and the processes it started."""
+        pid_file = workspace.workspace_dir / "child.pid"
+        task = asyncio.create_task(
+            bash_tool.execute(command="sleep 30 & echo $! > child.pid; wait", timeout=60)
+        )
+        while not pid_file.exists() or not pid_file.read_text().strip():
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stat_file = Path("/proc") / pid_file.read_text().strip() / "stat"
+        for _ in range(500):
+            # Gone, or a zombie waiting to be reaped
+            try:
+                if stat_file.read_text().split()[2] == "Z":
+                    break
+            except FileNotFoundError:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            pytest.fail("background command survived cancellation")
@@ -1,6 +1,9 @@
 """Tests for file operation tools."""
 
+import os
+import shutil
 import tempfile
+from contextlib import nullcontext
 from pathlib import Path
 
 import pytest
@@ -8,28 +11,115 @@ import pytest
 from researcher.core.workspace import WorkspaceManager
 from researcher.tools.file_tools import EditTool, ReadTool, WriteTool
 
+# The tests share no loop state, so run them all on one session-wide event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
 
-@pytest.fixture
-def temp_workspace():
-    """Create a temporary workspace for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
+# Memory-backed filesystem used for workspaces when available
+SHM_DIR = "/dev/shm"
+
+# Lines of the three-line sample file used by the read tests
+EXPECTED_LINES = ("Line 1", "Line 2", "Line 3")
+
+# Read-only sample files ("Line 1", "Line 2", ...) shared by the read tests,
+# mapped to their line counts
+SEEDED_FILES = {"one.txt": 1, "three.txt": 3, "five.txt": 5}
+
+# Directories created once per module and kept (emptied) between tests.
+# subdir/nested is deliberately absent: WriteTool must create it itself.
+WORKSPACE_DIRS = ("data",)
+
+
+def _seed(path: Path, data: str | bytes) -> None:
+    """Create or replace a test file with a single write."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _err_has(result, *needles: str) -> bool:
+    """Check that a failed result's error contains every needle, ignoring case."""
+    error = result.error.lower()
+    return all(needle in error for needle in needles)
+
+
+@pytest.fixture(scope="module")
+def temp_workspace(tmp_path_factory):
+    """Create a temporary workspace shared by the tests in this module.
+
+    The directory lives on tmpfs when /dev/shm is available, so the tests do
+    no disk I/O while the tools still get real file descriptors (they mmap
+    files, which an emulated filesystem cannot provide). Otherwise it comes
+    from pytest's tmp_path_factory. WORKSPACE_DIRS are created up front, and
+    _clean_workspace empties the workspace before every test.
+    """
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK):
+        root = tempfile.TemporaryDirectory(dir=SHM_DIR, prefix="researcher-fw-")
+    else:
+        root = nullcontext(tmp_path_factory.mktemp("fw"))
+
+    with root as tmpdir:
         workspace = WorkspaceManager(tmpdir)
+        _make_layout(workspace.workspace_dir)
         yield workspace
 
 
-@pytest.fixture
+def _make_layout(root: Path) -> None:
+    """Create the shared WORKSPACE_DIRS under a workspace root."""
+    for name in WORKSPACE_DIRS:
+        os.makedirs(root / name, exist_ok=True)
+
+
+def _remove_entries(path: str | Path, keep: tuple[str, ...] = ()) -> None:
+    """Remove everything inside a directory except the entries named in keep."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name in keep:
+                _remove_entries(entry.path)
+            elif entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+
+@pytest.fixture(autouse=True)
+def _clean_workspace(temp_workspace):
+    """Start every test with a workspace holding only the empty WORKSPACE_DIRS."""
+    _remove_entries(temp_workspace.workspace_dir, keep=WORKSPACE_DIRS)
+
+
+@pytest.fixture(scope="module")
 def read_tool(temp_workspace):
     """Create a ReadTool instance with temp workspace."""
     return ReadTool(temp_workspace)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def seeded_read_tool(tmp_path_factory):
+    """Create a ReadTool over a read-only workspace holding SEEDED_FILES.
+
+    The files are written once per module and never modified, so read tests
+    can share them instead of seeding their own copies.
+    """
+    workspace = WorkspaceManager(tmp_path_factory.mktemp("seeded"))
+    for name, line_count in SEEDED_FILES.items():
+        _seed(
+            workspace.workspace_dir / name,
+            "".join(f"Line {i}\n" for i in range(1, line_count + 1)),
+        )
+    return ReadTool(workspace)
+
+
+@pytest.fixture(scope="module")
 def write_tool(temp_workspace):
     """Create a WriteTool instance with temp workspace."""
     return WriteTool(temp_workspace)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def edit_tool(temp_workspace):
     """Create an EditTool instance with temp workspace."""
     return EditTool(temp_workspace)
@@ -38,84 +128,157 @@ def edit_tool(temp_workspace):
 class TestReadTool:
     """Test ReadTool functionality."""
 
-    async def test_read_simple_file(self, temp_workspace, read_tool):
-        """Test reading a simple text file."""
-        # Create a test file
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3\n")
+    @pytest.mark.parametrize(
+        ("filepath", "kwargs", "expected", "unexpected", "metadata", "error"),
+        [
+            pytest.param(
+                "one.txt",
+                {},
+                ("Line 1",),
+                (),
+                {"total_lines": 1, "lines_read": 1},
+                None,
+                id="single-line",
+            ),
+            pytest.param(
+                "three.txt",
+                {},
+                EXPECTED_LINES,
+                (),
+                {"total_lines": 3, "lines_read": 3},
+                None,
+                id="whole-file",
+            ),
+            pytest.param(
+                "five.txt",
+                {"start_line": 2, "end_line": 4},
+                ("Line 2", "Line 3", "Line 4"),
+                ("Line 1", "Line 5"),
+                {"lines_read": 3},
+                None,
+                id="line-range",
+            ),
+            pytest.param(
+                "three.txt",
+                {"start_line": 10},
+                (),
+                (),
+                {},
+                "out of range",
+                id="start-past-end",
+            ),
+        ],
+    )
+    async def test_read_cases(
+        self, seeded_read_tool, filepath, kwargs, expected, unexpected, metadata, error
+    ):
+        """Test reading a file whole, by line range, and with an invalid range."""
+        result = await seeded_read_tool.execute(filepath=filepath, **kwargs)
+
+        if error is not None:
+            assert result.success is False
+            assert _err_has(result, error)
+            return
+
+        assert result.success is True
+        # Compare whole lines (numbering stripped) against the expected sets
+        lines = {line.partition("→")[2] for line in result.content.split("\n")}
+        assert set(expected) <= lines
+        assert lines.isdisjoint(unexpected)
+        for key, value in metadata.items():
+            assert result.metadata[key] == value
+
+    async def test_read_narrow_window_of_large_file(self, temp_workspace, read_tool):
+        """Test reading a few lines from a large file without a trailing newline."""
+        test_file = temp_workspace.workspace_dir / "large.txt"
+        _seed(test_file, "\r\n".join(f"Line {i}" for i in range(1, 10001)))
 
-        # Read the file
-        result = await read_tool.execute(filepath="test.txt")
+        result = await read_tool.execute(filepath="large.txt", start_line=5000, end_line=5001)
 
         assert result.success is True
-        assert "Line 1" in result.content
-        assert "Line 2" in result.content
-        assert "Line 3" in result.content
-        assert result.metadata["total_lines"] == 3
-        assert result.metadata["lines_read"] == 3
-
-    async def test_read_with_line_range(self, temp_workspace, read_tool):
-        """Test reading specific line range."""
-        # Create a test file
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3\nLine 4\nLine 5\n")
+        assert result.content == "  5000→Line 5000\n  5001→Line 5001"
+        assert result.metadata["total_lines"] == 10000
 
-        # Read lines 2-4
-        result = await read_tool.execute(filepath="test.txt", start_line=2, end_line=4)
+        result = await read_tool.execute(filepath="large.txt", start_line=10000, end_line=10000)
 
         assert result.success is True
-        assert "Line 2" in result.content
-        assert "Line 3" in result.content
-        assert "Line 4" in result.content
-        assert "Line 1" not in result.content
-        assert "Line 5" not in result.content
-        assert result.metadata["lines_read"] == 3
+        assert result.content == " 10000→Line 10000"
+
+    async def test_read_range_numbers_lone_cr_like_whole_file(self, temp_workspace, read_tool):
+        """Test that line ranges split on a lone "\\r" just like whole-file reads."""
+        _seed(temp_workspace.workspace_dir / "cr.txt", b"a\rb\rc")
+
+        whole = await read_tool.execute(filepath="cr.txt")
+        first = await read_tool.execute(filepath="cr.txt", start_line=1, end_line=1)
+        second = await read_tool.execute(filepath="cr.txt", start_line=2)
+
+        assert whole.metadata["total_lines"] == 3
+        assert first.content == "     1→a"
+        assert first.metadata["total_lines"] == 3
+        assert second.success is True
+        assert second.content == "     2→b\n     3→c"
 
     async def test_read_nonexistent_file(self, read_tool):
         """Test reading a file that doesn't exist."""
         result = await read_tool.execute(filepath="nonexistent.txt")
 
         assert result.success is False
-        assert "not found" in result.error.lower()
+        assert _err_has(result, "not found")
 
     async def test_read_file_outside_workspace(self, temp_workspace, read_tool):
         """Test that reading outside workspace is blocked."""
         result = await read_tool.execute(filepath="/etc/passwd")
 
         assert result.success is False
-        assert "outside workspace" in result.error.lower()
-
-    async def test_read_with_invalid_line_range(self, temp_workspace, read_tool):
-        """Test reading with invalid line range."""
-        # Create a test file with 3 lines
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3\n")
-
-        # Try to read lines starting from line 10
-        result = await read_tool.execute(filepath="test.txt", start_line=10)
-
-        assert result.success is False
-        assert "out of range" in result.error.lower()
+        assert _err_has(result, "outside workspace")
 
 
 class TestWriteTool:
     """Test WriteTool functionality."""
 
-    async def test_write_create_new_file(self, write_tool):
-        """Test creating a new file."""
-        result = await write_tool.execute(
-            filepath="new_file.txt", content="Hello World", mode="create"
-        )
+    @pytest.mark.parametrize(
+        ("initial_text", "mode", "content", "verb", "final_text"),
+        [
+            pytest.param(None, "create", "Hello World", "Created", "Hello World", id="create"),
+            pytest.param(
+                "Original content",
+                "overwrite",
+                "New content",
+                "Overwrote",
+                "New content",
+                id="overwrite",
+            ),
+            pytest.param(
+                "Original content\n",
+                "append",
+                "Appended content\n",
+                "Appended",
+                "Original content\nAppended content\n",
+                id="append",
+            ),
+        ],
+    )
+    async def test_write_modes(
+        self, temp_workspace, write_tool, initial_text, mode, content, verb, final_text
+    ):
+        """Test the create, overwrite and append write modes."""
+        test_file = temp_workspace.workspace_dir / "test.txt"
+        if initial_text is not None:
+            _seed(test_file, initial_text)
+
+        result = await write_tool.execute(filepath="test.txt", content=content, mode=mode)
 
         assert result.success is True
-        assert "Created" in result.content
-        assert result.metadata["mode"] == "create"
+        assert verb in result.content
+        assert result.metadata["mode"] == mode
+        assert result.metadata["bytes_written"] == len(content.encode())
+        assert test_file.read_text() == final_text
 
     async def test_write_create_existing_file_fails(self, temp_workspace, write_tool):
         """Test that create mode fails if file exists."""
         # Create a file first
         test_file = temp_workspace.workspace_dir / "existing.txt"
-        test_file.write_text("Original content")
+        _seed(test_file, "Original content")
 
         # Try to create again
         result = await write_tool.execute(
@@ -123,43 +286,15 @@ class TestWriteTool:
         )
 
         assert result.success is False
-        assert "already exists" in result.error.lower()
-
-    async def test_write_overwrite_mode(self, temp_workspace, write_tool):
-        """Test overwrite mode."""
-        # Create a file first
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Original content")
-
-        # Overwrite it
-        result = await write_tool.execute(
-            filepath="test.txt", content="New content", mode="overwrite"
-        )
-
-        assert result.success is True
-        assert "Overwrote" in result.content
+        assert _err_has(result, "already exists")
 
-        # Verify content was replaced
-        assert test_file.read_text() == "New content"
-
-    async def test_write_append_mode(self, temp_workspace, write_tool):
-        """Test append mode."""
-        # Create a file first
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Original content\n")
-
-        # Append to it
-        result = await write_tool.execute(
-            filepath="test.txt", content="Appended content\n", mode="append"
-        )
+    async def test_write_reports_encoded_size(self, temp_workspace, write_tool):
+        """Test that bytes_written counts UTF-8 bytes, not characters."""
+        result = await write_tool.execute(filepath="utf8.txt", content="héllo\n", mode="create")
 
         assert result.success is True
-        assert "Appended" in result.content
-
-        # Verify content was appended
-        content = test_file.read_text()
-        assert "Original content" in content
-        assert "Appended content" in content
+        assert result.metadata["bytes_written"] == 7
+        assert (temp_workspace.workspace_dir / "utf8.txt").read_text(encoding="utf-8") == "héllo\n"
 
     async def test_write_creates_parent_directories(self, temp_workspace, write_tool):
         """Test that write creates parent directories."""
@@ -183,100 +318,159 @@ class TestWriteTool:
         )
 
         assert result.success is False
-        assert "outside workspace" in result.error.lower()
+        assert _err_has(result, "outside workspace")
 
 
 class TestEditTool:
     """Test EditTool functionality."""
 
-    async def test_edit_simple_replacement(self, temp_workspace, edit_tool):
-        """Test simple text replacement."""
-        # Create a test file
-        test_file = temp_workspace.workspace_dir / "config.txt"
-        test_file.write_text("DEBUG = False\nVERBOSE = True\n")
+    @pytest.mark.parametrize(
+        ("initial_text", "old_string", "new_string", "final_text", "errors"),
+        [
+            pytest.param(
+                "DEBUG = False\nVERBOSE = True\n",
+                "DEBUG = False",
+                "DEBUG = True",
+                "DEBUG = True\nVERBOSE = True\n",
+                [],
+                id="simple",
+            ),
+            pytest.param(
+                "Line 1\nLine 2\nLine 3\nLine 4\n",
+                "Line 2\nLine 3",
+                "Modified Line 2\nModified Line 3",
+                "Line 1\nModified Line 2\nModified Line 3\nLine 4\n",
+                [],
+                id="multiline",
+            ),
+            pytest.param(
+                "Hello World", "Goodbye", "Hello", "Hello World", ["not found"], id="not-found"
+            ),
+            pytest.param(
+                "Hello\nHello\nHello\n",
+                "Hello",
+                "Goodbye",
+                "Hello\nHello\nHello\n",
+                ["3 times", "unique"],
+                id="not-unique",
+            ),
+        ],
+    )
+    async def test_edit_cases(
+        self, temp_workspace, edit_tool, initial_text, old_string, new_string, final_text, errors
+    ):
+        """Test replacements that succeed and ones rejected as missing or ambiguous."""
+        test_file = temp_workspace.workspace_dir / "test.txt"
+        _seed(test_file, initial_text)
 
-        # Edit it
         result = await edit_tool.execute(
-            filepath="config.txt",
-            old_string="DEBUG = False",
-            new_string="DEBUG = True",
+            filepath="test.txt",
+            old_string=old_string,
+            new_string=new_string,
         )
 
-        assert result.success is True
-        assert "replaced 1 occurrence" in result.content.lower()
+        if errors:
+            assert result.success is False
+            assert _err_has(result, *errors)
+        else:
+            assert result.success is True
+            assert "replaced 1 occurrence" in result.content.lower()
+            assert result.metadata["file_size"] == len(final_text.encode())
+        assert test_file.read_text() == final_text
 
-        # Verify content was changed
-        content = test_file.read_text()
-        assert "DEBUG = True" in content
-        assert "DEBUG = False" not in content
+    async def test_edit_same_length_replacement(self, temp_workspace, edit_tool):
+        """Test an equal-length replacement after multi-byte characters."""
+        test_file = temp_workspace.workspace_dir / "status.txt"
+        _seed(test_file, "Café menu\nStatus: open\nEnd\n")
 
-    async def test_edit_nonexistent_file(self, edit_tool):
-        """Test editing a file that doesn't exist."""
         result = await edit_tool.execute(
-            filepath="nonexistent.txt",
-            old_string="old",
-            new_string="new",
+            filepath="status.txt",
+            old_string="Status: open",
+            new_string="Status: shut",
         )
 
-        assert result.success is False
-        assert "not found" in result.error.lower()
+        assert result.success is True
+        assert result.metadata["size_change"] == 0
+        assert test_file.read_text(encoding="utf-8") == "Café menu\nStatus: shut\nEnd\n"
 
-    async def test_edit_string_not_found(self, temp_workspace, edit_tool):
-        """Test editing with a string that doesn't exist in file."""
-        # Create a test file
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Hello World")
+    async def test_edit_preserves_other_bytes(self, temp_workspace, edit_tool):
+        """Test that a resizing edit leaves the rest of the file byte-for-byte intact."""
+        test_file = temp_workspace.workspace_dir / "crlf.txt"
+        _seed(test_file, b"first\r\nsecond\r\nthird\r\n")
 
-        # Try to replace non-existent string
         result = await edit_tool.execute(
-            filepath="test.txt",
-            old_string="Goodbye",
-            new_string="Hello",
+            filepath="crlf.txt",
+            old_string="second",
+            new_string="2nd",
         )
 
-        assert result.success is False
-        assert "not found" in result.error.lower()
+        assert result.success is True
+        assert test_file.read_bytes() == b"first\r\n2nd\r\nthird\r\n"
+        assert [p for p in temp_workspace.workspace_dir.iterdir() if p.is_file()] == [test_file]
 
-    async def test_edit_non_unique_string_fails(self, temp_workspace, edit_tool):
-        """Test that editing non-unique string fails."""
-        # Create a test file with duplicate text
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Hello\nHello\nHello\n")
+    async def test_edit_multiline_in_crlf_file(self, temp_workspace, edit_tool):
+        """Test that "\\n" in old_string matches CRLF line breaks, keeping them CRLF."""
+        test_file = temp_workspace.workspace_dir / "crlf.txt"
+        _seed(test_file, b"a\r\nb\r\nc\r\n")
 
-        # Try to replace non-unique string
         result = await edit_tool.execute(
-            filepath="test.txt",
-            old_string="Hello",
-            new_string="Goodbye",
+            filepath="crlf.txt",
+            old_string="a\nb",
+            new_string="x\ny\nz",
+        )
+
+        assert result.success is True
+        assert test_file.read_bytes() == b"x\r\ny\r\nz\r\nc\r\n"
+        assert result.metadata["file_size"] == len(b"x\r\ny\r\nz\r\nc\r\n")
+
+    @pytest.mark.skipif(
+        not hasattr(os, "geteuid") or os.geteuid() == 0, reason="root can write read-only files"
+    )
+    async def test_edit_read_only_file_fails(self, temp_workspace, edit_tool):
+        """Test that a read-only file is not replaced even though its directory is writable."""
+        test_file = temp_workspace.workspace_dir / "locked.txt"
+        _seed(test_file, "keep me\n")
+        test_file.chmod(0o444)
+
+        result = await edit_tool.execute(
+            filepath="locked.txt", old_string="keep me", new_string="changed"
         )
 
         assert result.success is False
-        assert "3 times" in result.error
-        assert "unique" in result.error.lower()
+        assert _err_has(result, "permission denied")
+        assert test_file.read_text() == "keep me\n"
 
-    async def test_edit_multiline_replacement(self, temp_workspace, edit_tool):
-        """Test editing multiline text."""
-        # Create a test file
-        test_file = temp_workspace.workspace_dir / "test.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3\nLine 4\n")
+    async def test_edit_keeps_hard_links_and_symlinks(self, temp_workspace, edit_tool):
+        """Test that resizing edits reach the linked file instead of replacing the link."""
+        root = temp_workspace.workspace_dir
+        target = root / "target.txt"
+        _seed(target, "alpha beta\n")
+        os.link(target, root / "hard.txt")
+        (root / "soft.txt").symlink_to(target)
 
-        # Replace multiline text
         result = await edit_tool.execute(
-            filepath="test.txt",
-            old_string="Line 2\nLine 3",
-            new_string="Modified Line 2\nModified Line 3",
+            filepath="hard.txt", old_string="alpha", new_string="gamma delta"
+        )
+        assert result.success is True
+        result = await edit_tool.execute(
+            filepath=str(root / "soft.txt"), old_string="beta", new_string="b"
         )
-
         assert result.success is True
 
-        # Verify replacement
-        content = test_file.read_text()
-        assert "Modified Line 2" in content
-        assert "Modified Line 3" in content
-        # Verify the exact lines are replaced (not just checking substring)
-        lines = content.split("\n")
-        assert any("Modified Line 2" == line for line in lines)
-        assert any("Modified Line 3" == line for line in lines)
+        assert (root / "soft.txt").is_symlink()
+        assert os.stat(root / "hard.txt").st_ino == os.stat(target).st_ino
+        assert target.read_text() == "gamma delta b\n"
+
+    async def test_edit_nonexistent_file(self, edit_tool):
+        """Test editing a file that doesn't exist."""
+        result = await edit_tool.execute(
+            filepath="nonexistent.txt",
+            old_string="old",
+            new_string="new",
+        )
+
+        assert result.success is False
+        assert _err_has(result, "not found")
 
     async def test_edit_outside_workspace_fails(self, edit_tool):
         """Test that editing outside workspace is blocked."""
@@ -287,7 +481,7 @@ class TestEditTool:
         )
 
         assert result.success is False
-        assert "outside workspace" in result.error.lower()
+        assert _err_has(result, "outside workspace")
 
 
 class TestWorkspaceIntegration:
@@ -307,7 +501,7 @@ class TestWorkspaceIntegration:
         assert "Test data" in read_result.content
 
     async def test_full_workflow(self, temp_workspace, write_tool, read_tool, edit_tool):
-        """Test a complete workflow: write -> read -> edit -> read."""
+        """Test a complete workflow: write -> edit -> read."""
         # Step 1: Write a file
         write_result = await write_tool.execute(
             filepath="workflow.txt",
@@ -316,12 +510,7 @@ class TestWorkspaceIntegration:
         )
         assert write_result.success is True
 
-        # Step 2: Read it
-        read_result = await read_tool.execute(filepath="workflow.txt")
-        assert read_result.success is True
-        assert "Version: 1.0" in read_result.content
-
-        # Step 3: Edit it
+        # Step 2: Edit it
         edit_result = await edit_tool.execute(
             filepath="workflow.txt",
             old_string="Status: draft",
@@ -329,8 +518,9 @@ class TestWorkspaceIntegration:
         )
         assert edit_result.success is True
 
-        # Step 4: Read again to verify
+        # Step 3: Read it back to verify
         final_result = await read_tool.execute(filepath="workflow.txt")
         assert final_result.success is True
+        assert "Version: 1.0" in final_result.content
         assert "Status: final" in final_result.content
         assert "Status: draft" not in final_result.content
@@ -0,0 +1,22 @@
+"""Tests for the default logger configuration."""
+
+from loguru import logger
+
+import researcher.agents.searcher  # noqa: F401  (imports the package as a library user would)
+from researcher.core.agent import BaseAgent
+from researcher.utils.logger import ensure_logger_configured, get_logger
+
+
+def test_user_sink_survives_agent_construction(tmp_path):
+    """Test that building agents and getting loggers leaves caller-added sinks in place."""
+    messages: list[str] = []
+    sink_id = logger.add(lambda message: messages.append(message.record["message"]))
+    try:
+        BaseAgent("tester", "You test.", None, [], tmp_path)
+        ensure_logger_configured()
+        get_logger(__name__).info("after setup")
+    finally:
+        logger.remove(sink_id)
+
+    assert any(m.startswith("Initialized tester agent") for m in messages)
+    assert "after setup" in messages
@@ -0,0 +1,59 @@
+"""Tests for PromptLoader."""
+
+import os
+
+import pytest
+
+from researcher.utils.prompt_loader import PromptLoader
+
+
+def set_dir_mtime(path, mtime_ns):
+    """Set a directory's mtime explicitly, so cache checks don't depend on timer resolution."""
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Create a loader over a prompts directory holding two prompts."""
+    (tmp_path / "analyzer.txt").write_text("Analyze.")
+    (tmp_path / "searcher.txt").write_text("Search.")
+    (tmp_path / "notes.md").write_text("Not a prompt.")
+    set_dir_mtime(tmp_path, 1_000_000_000_000_000_000)
+    return PromptLoader(tmp_path)
+
+
+class TestListPrompts:
+    """Test the mtime-keyed list_prompts() cache."""
+
+    def test_cache_hit_returns_copy(self, loader):
+        """Test that mutating a returned list does not change later results."""
+        first = loader.list_prompts()
+        assert first == ["analyzer", "searcher"]
+
+        first.append("bogus")
+        assert loader.list_prompts() == ["analyzer", "searcher"]
+
+    def test_unchanged_mtime_serves_cache(self, loader):
+        """Test that the directory is not rescanned while its mtime is unchanged."""
+        assert loader.list_prompts() == ["analyzer", "searcher"]
+
+        (loader.prompts_dir / "writer.txt").write_text("Write.")
+        set_dir_mtime(loader.prompts_dir, 1_000_000_000_000_000_000)
+
+        assert loader.list_prompts() == ["analyzer", "searcher"]
+
+    def test_adding_and_removing_prompts_invalidates_cache(self, loader):
+        """Test that a new directory mtime triggers a rescan."""
+        assert loader.list_prompts() == ["analyzer", "searcher"]
+
+        (loader.prompts_dir / "writer.txt").write_text("Write.")
+        set_dir_mtime(loader.prompts_dir, 2_000_000_000_000_000_000)
+        assert loader.list_prompts() == ["analyzer", "searcher", "writer"]
+
+        (loader.prompts_dir / "analyzer.txt").unlink()
+        set_dir_mtime(loader.prompts_dir, 3_000_000_000_000_000_000)
+        assert loader.list_prompts() == ["searcher", "writer"]
+
+    def test_missing_directory_lists_nothing(self, tmp_path):
+        """Test that a nonexistent prompts directory yields an empty list."""
+        assert PromptLoader(tmp_path / "missing").list_prompts() == []
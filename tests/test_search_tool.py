@@ -1,57 +1,80 @@
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
-from researcher.tools.search_tool import TavilySearchTool
-
-
-class FakeTavilyClient:
-    def __init__(self, response: dict | None = None, should_raise: bool = False):
-        self.response = response or {
-            "results": [
-                {
-                    "title": "AI Advances 2024",
-                    "url": "https://example.com/ai",
-                    "content": "Overview of the latest AI advances in 2024.",
-                },
-                {
-                    "title": "Research Trends",
-                    "url": "https://example.com/trends",
-                    "content": "Key research trends summarized.",
-                },
-            ],
-            "answer": "Summary goes here.",
-        }
-        self.should_raise = should_raise
-        self.calls = []
-
-    async def search(self, **kwargs):
-        self.calls.append(kwargs)
-        if self.should_raise:
-            raise RuntimeError("network error")
-        return self.response
-
-
-@pytest.mark.asyncio
-async def test_tavily_search_tool_success():
-    fake_client = FakeTavilyClient()
-    tool = TavilySearchTool(client=fake_client)
+from researcher.tools.search_tool import TavilySearchTool, aclose_all
+
+SEARCH_RESPONSE = {
+    "results": [
+        {
+            "title": "AI Advances 2024",
+            "url": "https://example.com/ai",
+            "content": "Overview of the latest AI advances in 2024.",
+        },
+        {
+            "title": "Research Trends",
+            "url": "https://example.com/trends",
+            "content": "Key research trends summarized.",
+        },
+    ],
+    "answer": "Summary goes here.",
+}
+
+
+def make_fake_client(should_raise: bool = False) -> AsyncMock:
+    """Create a mock Tavily client whose search returns SEARCH_RESPONSE or fails."""
+    client = AsyncMock()
+    client.search = AsyncMock(return_value=SEARCH_RESPONSE)
+    if should_raise:
+        client.search.side_effect = RuntimeError("network error")
+    return client
+
+
+@pytest.fixture(scope="module")
+def search_tool(request):
+    """Create a TavilySearchTool over a fake client; parametrize indirectly with
+    should_raise=True to get a client whose searches fail."""
+    fake_client = make_fake_client(should_raise=getattr(request, "param", False))
+    return TavilySearchTool(client=fake_client), fake_client
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tavily_search_tool_success(search_tool):
+    tool, fake_client = search_tool
 
     result = await tool.execute(query="ai breakthroughs")
 
     assert result.success is True
     assert "Found 2 results" in result.content
     assert result.metadata["result_count"] == 2
-    assert result.metadata["response"] == fake_client.response
-
-    call_args = fake_client.calls[0]
+    assert "response" not in result.metadata
+    assert result.metadata["answer"] == "Summary goes here."
+    assert result.metadata["results"][0] == {
+        "title": "AI Advances 2024",
+        "url": "https://example.com/ai",
+        "snippet": "Overview of the latest AI advances in 2024.",
+    }
+
+    call_args = fake_client.search.call_args.kwargs
     assert call_args["query"] == "ai breakthroughs"
     assert call_args["max_results"] == tool.DEFAULT_MAX_RESULTS
     assert call_args["search_depth"] == tool.DEFAULT_SEARCH_DEPTH
 
 
-@pytest.mark.asyncio
-async def test_tavily_search_tool_handles_errors():
-    fake_client = FakeTavilyClient(should_raise=True)
-    tool = TavilySearchTool(client=fake_client)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tavily_search_tool_can_keep_raw_response():
+    tool = TavilySearchTool(client=make_fake_client(), include_raw_response=True)
+
+    result = await tool.execute(query="ai breakthroughs")
+
+    assert result.metadata["raw_response"] == SEARCH_RESPONSE
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize("search_tool", [True], indirect=True)
+async def test_tavily_search_tool_handles_errors(search_tool):
+    tool, _ = search_tool
 
     result = await tool.execute(query="ai breakthroughs", max_results=5)
 
@@ -65,10 +88,9 @@ def test_tavily_search_tool_requires_api_key(monkeypatch):
         TavilySearchTool()
 
 
-@pytest.mark.asyncio
-async def test_tavily_search_tool_validates_inputs():
-    fake_client = FakeTavilyClient()
-    tool = TavilySearchTool(client=fake_client)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tavily_search_tool_validates_inputs(search_tool):
+    tool, _ = search_tool
 
     result = await tool.execute(query="", max_results=0)
     assert result.success is False
@@ -81,3 +103,27 @@ async def test_tavily_search_tool_validates_inputs():
     result = await tool.execute(query="ai", search_depth="deep")
     assert result.success is False
     assert "search_depth" in result.error
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_tavily_search_tool_shares_client_per_api_key():
+    first = TavilySearchTool(api_key="tvly-shared")
+    second = TavilySearchTool(api_key="tvly-shared")
+    other = TavilySearchTool(api_key="tvly-other")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+
+    shared = first.client
+    await aclose_all()
+    assert TavilySearchTool(api_key="tvly-shared").client is not shared
+    await aclose_all()
+
+
+def test_tavily_search_tool_client_per_event_loop():
+    tool = TavilySearchTool(api_key="tvly-loops")
+
+    async def client_for_loop():
+        return tool.client
+
+    assert asyncio.run(client_for_loop()) is not asyncio.run(client_for_loop())
@@ -35,6 +35,29 @@ class DummyTool(Tool):
         )
 
 
+def _check_anthropic_schema(schema: dict, tool: Tool) -> None:
+    """Check a tool schema in Anthropic format."""
+    assert schema["name"] == "dummy_tool"
+    assert schema["description"] == "A dummy tool for testing purposes"
+    assert "input_schema" in schema
+    assert schema["input_schema"] == tool.parameters
+
+
+def _check_openai_schema(schema: dict, tool: Tool) -> None:
+    """Check a tool schema in OpenAI format."""
+    assert schema["type"] == "function"
+    assert "function" in schema
+    assert schema["function"]["name"] == "dummy_tool"
+    assert schema["function"]["description"] == "A dummy tool for testing purposes"
+    assert schema["function"]["parameters"] == tool.parameters
+
+
+@pytest.fixture(scope="module")
+def dummy_tool():
+    """Create a DummyTool shared by the tests in this module."""
+    return DummyTool()
+
+
 class TestToolResult:
     """Test ToolResult data model."""
 
@@ -71,41 +94,29 @@ class TestToolResult:
 class TestTool:
     """Test Tool abstract base class."""
 
-    def test_tool_properties(self):
+    def test_tool_properties(self, dummy_tool):
         """Test that tool properties are accessible."""
-        tool = DummyTool()
-        assert tool.name == "dummy_tool"
-        assert tool.description == "A dummy tool for testing purposes"
-        assert "properties" in tool.parameters
-        assert "input" in tool.parameters["properties"]
+        assert dummy_tool.name == "dummy_tool"
+        assert dummy_tool.description == "A dummy tool for testing purposes"
+        assert "properties" in dummy_tool.parameters
+        assert "input" in dummy_tool.parameters["properties"]
 
-    async def test_tool_execute(self):
+    async def test_tool_execute(self, dummy_tool):
         """Test tool execution."""
-        tool = DummyTool()
-        result = await tool.execute(input="hello world")
+        result = await dummy_tool.execute(input="hello world")
 
         assert isinstance(result, ToolResult)
         assert result.success is True
         assert result.content == "Processed: hello world"
         assert result.metadata == {"input_length": 11}
 
-    def test_tool_to_anthropic_schema(self):
-        """Test conversion to Anthropic schema format."""
-        tool = DummyTool()
-        schema = tool.to_schema()
-
-        assert schema["name"] == "dummy_tool"
-        assert schema["description"] == "A dummy tool for testing purposes"
-        assert "input_schema" in schema
-        assert schema["input_schema"] == tool.parameters
-
-    def test_tool_to_openai_schema(self):
-        """Test conversion to OpenAI schema format."""
-        tool = DummyTool()
-        schema = tool.to_openai_schema()
-
-        assert schema["type"] == "function"
-        assert "function" in schema
-        assert schema["function"]["name"] == "dummy_tool"
-        assert schema["function"]["description"] == "A dummy tool for testing purposes"
-        assert schema["function"]["parameters"] == tool.parameters
+    @pytest.mark.parametrize(
+        ("method", "check"),
+        [
+            pytest.param("to_schema", _check_anthropic_schema, id="anthropic"),
+            pytest.param("to_openai_schema", _check_openai_schema, id="openai"),
+        ],
+    )
+    def test_tool_schema(self, dummy_tool, method, check):
+        """Test conversion to the Anthropic and OpenAI schema formats."""
+        check(getattr(dummy_tool, method)(), dummy_tool)
@@ -0,0 +1,160 @@
+"""Tests for AgentTraceLogger."""
+
+import json
+import struct
+import time
+
+import pytest
+
+from researcher.utils.trace_logger import AgentTraceLogger
+
+
+def read_events(trace_logger):
+    """Load all events from the JSONL trace file."""
+    with open(trace_logger.trace_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.fixture
+def trace_logger(tmp_path):
+    """Create an enabled trace logger writing into a temporary directory."""
+    return AgentTraceLogger(tmp_path)
+
+
+def log_sample_session(trace_logger):
+    """Log a small orchestrator session with one tool call."""
+    trace_logger.log_agent_start("orchestrator", "Research topic", parent_agent=None)
+    trace_logger.log_tool_call("orchestrator", "web_search", {"query": "x" * 150})
+    trace_logger.log_tool_result("orchestrator", "web_search", True, "Found results")
+    trace_logger.log_llm_call("orchestrator", "test-model", input_tokens=10, output_tokens=5)
+    trace_logger.log_agent_complete("orchestrator", True, "Done", steps_used=3)
+
+
+class TestAgentTraceLogger:
+    """Test trace recording and summary output."""
+
+    def test_events_written_on_finalize(self, trace_logger):
+        """Test that buffered events reach the JSONL file and the summary is rendered."""
+        log_sample_session(trace_logger)
+        trace_logger.finalize()
+
+        events = read_events(trace_logger)
+        assert [e["event_type"] for e in events] == [
+            "agent_start",
+            "tool_call",
+            "tool_result",
+            "llm_call",
+            "agent_complete",
+            "session_complete",
+        ]
+        assert all("timestamp" in e and "ts_ns" not in e for e in events)
+        assert events[1]["arguments"]["query"] == "x" * 100 + "..."
+        assert events[-1]["statistics"]["tools"]["web_search"]["successes"] == 1
+
+        summary = trace_logger.trace_md_file.read_text(encoding="utf-8")
+        assert "| orchestrator | 1 | 1 | 1 | 0 |" in summary
+        assert "| web_search | 1 | 1 | 0 | 100.0% |" in summary
+        assert "`orchestrator` → `web_search`" in summary
+
+    def test_wide_integer_arguments_encoded(self, trace_logger):
+        """Test that values orjson rejects are still encoded like the stdlib would."""
+        trace_logger.log_tool_call("searcher", "calc", {"n": 2**70})
+        trace_logger.finalize()
+
+        assert read_events(trace_logger)[0]["arguments"]["n"] == 2**70
+
+    def test_malformed_event_does_not_stop_writer(self, trace_logger):
+        """Test that an event failing to render is skipped and later events still land."""
+        trace_logger.log_agent_start("searcher", None)
+        trace_logger.log_llm_call("searcher", "test-model")
+        trace_logger._flush()
+        trace_logger.finalize()
+
+        assert [e["event_type"] for e in read_events(trace_logger)] == [
+            "agent_start",
+            "llm_call",
+            "session_complete",
+        ]
+        assert "LLM call (test-model)" in trace_logger.trace_md_file.read_text(encoding="utf-8")
+
+    async def test_afinalize_appends_summary_after_timeline(self, trace_logger):
+        """Test that the async finalize writes all events before the summary."""
+        log_sample_session(trace_logger)
+        await trace_logger.afinalize()
+
+        assert read_events(trace_logger)[-1]["event_type"] == "session_complete"
+        summary = trace_logger.trace_md_file.read_text(encoding="utf-8")
+        assert summary.index("completed (3 steps)") < summary.index("## Session Summary")
+
+    def test_flush_writes_queued_events(self, trace_logger):
+        """Test that flushing waits for the writer thread to persist queued events."""
+        trace_logger.log_agent_start("searcher", "Task")
+        for _ in range(trace_logger.FLUSH_MAX_EVENTS * 2):
+            trace_logger.log_llm_call("searcher", "test-model")
+        trace_logger._flush()
+
+        assert len(read_events(trace_logger)) == trace_logger.FLUSH_MAX_EVENTS * 2 + 1
+
+    def test_events_written_after_flush_interval(self, tmp_path):
+        """Test that a lone event reaches disk once the flush interval passes."""
+        trace_logger = AgentTraceLogger(tmp_path, flush_interval_ms=20)
+        trace_logger.log_agent_start("searcher", "Task")
+
+        deadline = time.monotonic() + 5
+        while not trace_logger.trace_file.stat().st_size and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert [e["event_type"] for e in read_events(trace_logger)] == ["agent_start"]
+        trace_logger.finalize()
+
+    def test_timeline_covers_only_current_session(self, tmp_path):
+        """Test that a continued workspace renders only its own events."""
+        first = AgentTraceLogger(tmp_path)
+        first.log_agent_start("orchestrator", "First session")
+        first.finalize()
+
+        second = AgentTraceLogger(tmp_path)
+        second.log_agent_start("orchestrator", "Second session")
+        second.finalize()
+
+        summary = second.trace_md_file.read_text(encoding="utf-8")
+        assert "Second session" in summary
+        assert "First session" not in summary
+        assert len(read_events(second)) == 4
+
+    def test_disabled_logger_writes_nothing(self, tmp_path):
+        """Test that a disabled logger creates no files."""
+        trace_logger = AgentTraceLogger(tmp_path, enabled=False)
+        assert isinstance(trace_logger, AgentTraceLogger)
+        assert not trace_logger.enabled
+        log_sample_session(trace_logger)
+        trace_logger.finalize()
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_msgpack_format_round_trip(self, tmp_path):
+        """Test that msgpack frames are written and rendered into the summary."""
+        msgpack = pytest.importorskip("msgpack")
+        trace_logger = AgentTraceLogger(tmp_path, format="msgpack")
+        log_sample_session(trace_logger)
+        trace_logger.finalize()
+
+        assert trace_logger.trace_file.name == "agent_trace.msgpack"
+        data = trace_logger.trace_file.read_bytes()
+        events, pos = [], 0
+        while pos < len(data):
+            (size,) = struct.unpack_from("<I", data, pos)
+            events.append(msgpack.unpackb(data[pos + 4 : pos + 4 + size], raw=False))
+            pos += 4 + size
+        assert len(events) == 6
+        assert events[-1]["event_type"] == "session_complete"
+
+        summary = trace_logger.trace_md_file.read_text(encoding="utf-8")
+        assert "`orchestrator` → `web_search`" in summary
+
+    def test_unsupported_format_rejected(self, tmp_path):
+        """Test that an unknown format raises before any file is created."""
+        with pytest.raises(ValueError, match="Unsupported trace format"):
+            AgentTraceLogger(tmp_path, format="csv")
+
+        assert list(tmp_path.iterdir()) == []
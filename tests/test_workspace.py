@@ -0,0 +1,37 @@
+"""Tests for WorkspaceManager."""
+
+import pytest
+
+from researcher.core.workspace import WorkspaceManager
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """Create a workspace inside a temporary directory."""
+    return WorkspaceManager(tmp_path / "ws")
+
+
+class TestPathSafety:
+    """Test workspace path safety checks."""
+
+    def test_paths_inside_workspace_are_safe(self, workspace):
+        """Test that the root and paths below it are accepted."""
+        assert workspace.is_path_safe(".")
+        assert workspace.is_path_safe("data/file.txt")
+        assert workspace.is_path_safe(workspace.workspace_dir / "nested" / "file.txt")
+
+    def test_paths_outside_workspace_are_rejected(self, workspace):
+        """Test that escaping paths and sibling prefixes are rejected."""
+        assert not workspace.is_path_safe("../outside.txt")
+        assert not workspace.is_path_safe("/etc/passwd")
+        # Shares the root as a string prefix but is a different directory
+        assert not workspace.is_path_safe(f"{workspace.workspace_dir}-other/file.txt")
+
+    def test_locate_returns_relative_path(self, workspace):
+        """Test that locate resolves once and reports the relative path."""
+        resolved, relative = workspace.locate("data/../notes/file.txt")
+
+        assert resolved == workspace.workspace_dir / "notes" / "file.txt"
+        assert relative == str(workspace.get_relative_path(resolved))
+        assert workspace.locate(".")[1] == "."
+        assert workspace.locate("/etc/passwd")[1] is None